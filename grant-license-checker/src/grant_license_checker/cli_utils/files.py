@@ -1,14 +1,18 @@
+"""
+Note: this module is used by `merge-sboms`, it must only depend on the standard library
+      and support Python 3.8+ (see `grant_license_checker.sbom.merge`).
+"""
 import contextlib
 import logging
 from pathlib import Path
-from typing import TextIO, ContextManager
+from typing import TextIO, ContextManager, Union
 
 logger = logging.getLogger(__name__)
 
 
 @contextlib.contextmanager
 def cli_maybe_open_file(
-    path: Path | str | None, mode: str, default: TextIO
+    path: Union[Path, str, None], mode: str, default: TextIO
 ) -> ContextManager[TextIO]:
     """
     Attempts to open a given file, if it doesn't then it exits with an error immediately.
@@ -14,7 +14,13 @@ from typing import Self
 
 from grant_license_checker.cli_utils.files import cli_maybe_open_file
 from grant_license_checker.models.grant_json import GrantResponse
-from grant_license_checker.renderers import RENDERERS
+from grant_license_checker.pipeline.runner import run_pipeline
+from grant_license_checker.renderers import (
+    RENDERERS,
+    RENDERING_ENGINES,
+    REPORTS,
+    LicenseIndex,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +29,8 @@ logger = logging.getLogger(__name__)
 class Command:
     # Inputs:
     #   - data: the parsed grant JSON file.
+    #   - index: the packages grouped by license when they were indexed
+    #     while reading the input (--pipelined).
     data: GrantResponse
 
     # Outputs:
@@ -32,10 +40,17 @@ class Command:
     #   - output_format: which renderer to use
     #     (one of: grant_license_checker.renderers.RENDERERS).
     #   - output_path: where to save the results (defaults to stdout).
+    #   - engine: how to render the output
+    #     (one of: grant_license_checker.renderers.RENDERING_ENGINES).
+    #   - report: which report to render
+    #     (one of: grant_license_checker.renderers.REPORTS).
     list_packages: bool
     max_package_count: int
     output_format: str
     output_path: str
+    engine: str = "jinja"
+    report: str = "licenses"
+    index: LicenseIndex | None = None
 
     @classmethod
     def get_argparser(cls) -> argparse.ArgumentParser:
@@ -46,6 +61,16 @@ class Command:
         input_argparse.add_argument(
             "-i", "--input", required=True, help="The grant JSON output file"
         )
+        input_argparse.add_argument(
+            "-p",
+            "--pipelined",
+            help=(
+                "Decode and index the input while it is being read. Only useful "
+                "when a slow producer writes to stdin (e.g., grant check), "
+                "expect ~10%% faster at best. Otherwise, it is as fast as the default."
+            ),
+            action="store_true",
+        )
 
         # Output config
         output_argparse = parser.add_argument_group("Output Preferences")
@@ -82,6 +107,27 @@ class Command:
             help="The path to the output the result. Defaults to stdout.",
             default="-",
         )
+        output_argparse.add_argument(
+            "-e",
+            "--engine",
+            help=(
+                "The rendering engine, one of: "
+                "'jinja' (templates), 'compiled' (faster, same output as 'jinja')"
+            ),
+            choices=RENDERING_ENGINES.keys(),
+            default="jinja",
+        )
+        output_argparse.add_argument(
+            "-r",
+            "--report",
+            help=(
+                "The report to render, one of: "
+                "'licenses' (packages grouped by license), "
+                "'multi-license' (packages with multiple licenses)"
+            ),
+            choices=REPORTS.keys(),
+            default="licenses",
+        )
 
         # Logging config
         logging_argparse = parser.add_mutually_exclusive_group()
@@ -105,9 +151,28 @@ class Command:
             level=log_level, format="%(asctime)s | %(levelname)s | %(message)s"
         )
 
+        index = None
+        if args.pipelined:
+            data, index = cls.read_input_pipelined(args.input)
+        else:
+            data = cls.read_input(args.input)
+
+        return Command(
+            data=data,
+            index=index,
+            output_format=args.format,
+            list_packages=args.list_packages,
+            max_package_count=args.max_packages,
+            output_path=args.output,
+            engine=args.engine,
+            report=args.report,
+        )
+
+    @staticmethod
+    def read_input(path: str) -> GrantResponse:
         # Read and parse the JSON input file from grant.
         # stdin (shell pipe) is supported, it will be read until EOF.
-        with cli_maybe_open_file(args.input, "r", default=sys.stdin) as input_fp:
+        with cli_maybe_open_file(path, "r", default=sys.stdin) as input_fp:
             try:
                 raw = input_fp.read()
             except ValueError as exc:
@@ -118,21 +183,24 @@ class Command:
                 raise SystemExit(1) from exc
 
         try:
-            data = GrantResponse.model_validate_json(raw)
+            return GrantResponse.model_validate_json(raw)
         except ValueError as exc:
-            logger.error("Failed to parse the input file (%s): %s", args.input, exc)
+            logger.error("Failed to parse the input file (%s): %s", path, exc)
             sys.exit(1)
 
-        return Command(
-            data=data,
-            output_format=args.format,
-            list_packages=args.list_packages,
-            max_package_count=args.max_packages,
-            output_path=args.output,
-        )
+    @staticmethod
+    def read_input_pipelined(path: str) -> tuple[GrantResponse, LicenseIndex]:
+        # Same as read_input() but reading, decoding, and grouping packages
+        # by license run concurrently.
+        with cli_maybe_open_file(path, "r", default=sys.stdin) as input_fp:
+            try:
+                return run_pipeline(input_fp)
+            except ValueError as exc:
+                logger.error("Failed to parse the input file (%s): %s", path, exc)
+                sys.exit(1)
 
     def run(self):
-        renderer_cls = RENDERERS.get(self.output_format)
+        renderer_cls = RENDERING_ENGINES[self.engine].get(self.output_format)
 
         if renderer_cls is None:
             logger.error(
@@ -146,7 +214,13 @@ class Command:
             data=self.data,
             list_packages=self.list_packages,
             max_package_count=self.max_package_count,
+            report=self.report,
         )
+        if self.index is not None:
+            renderer.packages_by_license = self.index.seal()
+            renderer.multi_license_packages = (
+                self.index.get_packages_with_multiple_licenses()
+            )
 
         with cli_maybe_open_file(self.output_path, "w", default=sys.stdout) as out_fp:
             renderer.render(out_fp)
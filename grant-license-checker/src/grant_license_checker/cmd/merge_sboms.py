@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+This command merges CycloneDX 1.6 SBOMs into a single SBOM.
+
+Components are deduplicated by package URL (purl).
+
+Note: like `sbom.merge`, this command must only depend on the standard library and
+      support Python 3.8+ (see sbom-generator).
+"""
+import argparse
+import dataclasses
+import json
+import logging
+import sys
+from typing import List
+
+from grant_license_checker.cli_utils.files import cli_maybe_open_file
+from grant_license_checker.sbom.merge import SBOM, merge_sboms
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class Command:
+    # Inputs:
+    #   - sboms: the parsed SBOM files to merge (in order of precedence).
+    sboms: List[SBOM]
+
+    # Outputs:
+    #   - output_path: where to save the merged SBOM (defaults to stdout).
+    output_path: str
+
+    @classmethod
+    def get_argparser(cls) -> argparse.ArgumentParser:
+        parser = argparse.ArgumentParser(description=__doc__)
+
+        # Input config
+        input_argparse = parser.add_argument_group("Input Preferences")
+        input_argparse.add_argument(
+            "inputs", nargs="+", metavar="INPUT", help="The CycloneDX JSON files"
+        )
+
+        # Output config
+        output_argparse = parser.add_argument_group("Output Preferences")
+        output_argparse.add_argument(
+            "-o",
+            "--output",
+            help="The path to the output the result. Defaults to stdout.",
+            default="-",
+        )
+
+        # Logging config
+        logging_argparse = parser.add_mutually_exclusive_group()
+        logging_argparse.add_argument(
+            "-v", "--verbose", action="store_true", help="Enable verbose logging"
+        )
+        logging_argparse.add_argument(
+            "-D", "--debug", action="store_true", help="Enable debug logging"
+        )
+        return parser
+
+    @classmethod
+    def parse_args(cls) -> "Command":
+        args = cls.get_argparser().parse_args()
+
+        # Set-up logging level.
+        log_level = logging.WARNING
+        if args.verbose:
+            log_level = logging.INFO
+        elif args.debug:
+            log_level = logging.DEBUG
+
+        # Configure logging.
+        logging.basicConfig(
+            level=log_level, format="%(asctime)s | %(levelname)s | %(message)s"
+        )
+
+        sboms = []
+        for path in args.inputs:
+            with cli_maybe_open_file(path, "r", default=sys.stdin) as input_fp:
+                try:
+                    sboms.append(json.load(input_fp))
+                except ValueError as exc:
+                    logger.error("Failed to parse the input file (%s): %s", path, exc)
+                    sys.exit(1)
+
+        return Command(sboms=sboms, output_path=args.output)
+
+    def run(self):
+        try:
+            merged = merge_sboms(self.sboms)
+        except ValueError as exc:
+            logger.error("Failed to merge the SBOMs: %s", exc)
+            sys.exit(1)
+
+        with cli_maybe_open_file(self.output_path, "w", default=sys.stdout) as out_fp:
+            json.dump(merged, out_fp, indent=2)
+
+
+def main():
+    Command.parse_args().run()
+
+
+if __name__ == "__main__":
+    main()
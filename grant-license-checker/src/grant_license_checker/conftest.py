@@ -1,7 +1,21 @@
+import contextlib
+import functools
+import time
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 from .models.grant_json import GrantResponse
+from .renderers.base import BaseRenderer
+from .renderers.index import LicensesByPackage, PackagesByLicense
+from .tests.synthetic import generate_grant_report_json
+
+# Sizes (result counts) of the synthetic reports used by large-report tests.
+SYNTHETIC_REPORT_SIZES = {"1k": 1_000, "100k": 100_000}
+SYNTHETIC_REPORT_SEED = 42
+
+# How long the code under test may take on a large report (excludes fixtures).
+LARGE_REPORT_TIME_BUDGET_SECONDS = 30.0
 
 
 def get_fixture(filename: str) -> Path:
@@ -18,8 +32,59 @@ def get_fixture(filename: str) -> Path:
     return path
 
 
-@pytest.fixture
+@contextlib.contextmanager
+def within_time_budget(
+    seconds: float = LARGE_REPORT_TIME_BUDGET_SECONDS,
+) -> Iterator[None]:
+    """Fails if the wrapped code took longer than the given duration."""
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    assert elapsed <= seconds, f"Took {elapsed:.2f}s, time budget is {seconds:.2f}s"
+
+
+@functools.cache
+def load_synthetic_report(size: int) -> tuple[str, GrantResponse]:
+    """Returns a synthetic report as JSON and its parsed model (cached)."""
+    raw = generate_grant_report_json(size, seed=SYNTHETIC_REPORT_SEED)
+    return raw, GrantResponse.model_validate_json(raw)
+
+
+# Note: fixtures are session-scoped, tests must not modify them.
+@pytest.fixture(scope="session")
 def grant_json_report() -> GrantResponse:
     return GrantResponse.model_validate_json(
         get_fixture("sample-grant-report.json").read_text()
     )
+
+
+@pytest.fixture(
+    scope="session",
+    params=SYNTHETIC_REPORT_SIZES.values(),
+    ids=SYNTHETIC_REPORT_SIZES.keys(),
+)
+def synthetic_report_size(request) -> int:
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def synthetic_grant_json(synthetic_report_size) -> str:
+    """A synthetic grant JSON report for each size of SYNTHETIC_REPORT_SIZES."""
+    return load_synthetic_report(synthetic_report_size)[0]
+
+
+@pytest.fixture(scope="session")
+def synthetic_grant_report(synthetic_report_size) -> GrantResponse:
+    """Same as `synthetic_grant_json` but parsed."""
+    return load_synthetic_report(synthetic_report_size)[1]
+
+
+@pytest.fixture(scope="session")
+def reference_grouping(
+    synthetic_grant_report,
+) -> tuple[PackagesByLicense, LicensesByPackage]:
+    """The reference grouping of `synthetic_grant_report` (using BaseRenderer)."""
+    renderer = BaseRenderer(
+        data=synthetic_grant_report, list_packages=True, max_package_count=-1
+    )
+    return renderer.group_results()
@@ -0,0 +1,271 @@
+import enum
+import json
+import re
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+
+from grant_license_checker.models.grant_json import GrantEvaluations, GrantResponse
+
+# JSON whitespace characters (https://www.json.org/).
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Validates results in batches, which is faster than one by one.
+RESULTS_ADAPTER = TypeAdapter(list[GrantEvaluations])
+
+# Matches the end of a result, i.e., '}' followed by ',' or ']'.
+RESULT_END = re.compile(r"\}[ \t\n\r]*([,\]])")
+
+
+class _State(enum.Enum):
+    START = enum.auto()
+    KEY_OR_END = enum.auto()
+    KEY = enum.auto()
+    COLON = enum.auto()
+    VALUE = enum.auto()
+    VALUE_END = enum.auto()
+    RESULT_OR_END = enum.auto()
+    RESULT = enum.auto()
+    RESULT_END = enum.auto()
+    END = enum.auto()
+
+
+class _NeedMoreData(Exception):
+    pass
+
+
+class GrantResponseDecoder:
+    """
+    Incrementally decodes a grant JSON report, chunk by chunk.
+
+    Each item of `results` is decoded and validated as soon as it is complete,
+    other fields are only validated by `get_response()`.
+
+    Usage:
+        >>> decoder = GrantResponseDecoder()
+        >>> for chunk in chunks:
+        ...     for eval_result in decoder.feed(chunk):
+        ...         ...
+        >>> decoder.close()
+    """
+
+    RESULTS_KEY = "results"
+
+    def __init__(self) -> None:
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._state = _State.START
+
+        # The decoded top-level fields (except results) and the current key.
+        self._fields: dict[str, Any] = {}
+        self._key: str | None = None
+        self._has_results = False
+
+    def feed(self, chunk: str) -> list[GrantEvaluations]:
+        """Decodes a chunk, returns the results that were completed by the chunk.
+
+        Raises ValueError if the input is invalid.
+        """
+        if self._eof:
+            raise ValueError("Cannot feed data after the decoder was closed")
+
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return self._decode()
+
+    def close(self) -> list[GrantEvaluations]:
+        """Signals the end of the input, returns the remaining results.
+
+        Raises ValueError if the input is incomplete.
+        """
+        self._eof = True
+        results = self._decode()
+        if self._state is not _State.END:
+            raise ValueError("Unexpected end of input")
+        return results
+
+    def get_response(self, results: list[GrantEvaluations]) -> GrantResponse:
+        """Returns the decoded report given the results returned by `feed()`."""
+        if self._state is not _State.END:
+            raise ValueError("The input wasn't fully decoded")
+
+        fields = dict(self._fields)
+        if self._has_results:
+            # Results were already validated, only validate the other fields.
+            fields[self.RESULTS_KEY] = []
+        response = GrantResponse.model_validate(fields)
+        response.results = results
+        return response
+
+    def _decode(self) -> list[GrantEvaluations]:
+        results: list[Any] = []
+        try:
+            while self._state is not _State.END:
+                self._step(results)
+        except _NeedMoreData:
+            pass
+
+        self._skip_whitespace()
+        if self._state is _State.END and self._pos < len(self._buffer):
+            raise ValueError(f"Extra data at position {self._pos}")
+        return RESULTS_ADAPTER.validate_python(results)
+
+    def _step(self, results: list[Any]) -> None:
+        """Decodes the next token, decoded results are appended to `results`."""
+        state = self._state
+
+        if state is _State.START:
+            self._expect("{")
+            self._state = _State.KEY_OR_END
+        elif state in (_State.KEY_OR_END, _State.KEY):
+            if state is _State.KEY_OR_END and self._accept("}"):
+                self._state = _State.END
+                return
+            if self._peek() != '"':
+                raise ValueError(f"Expected a key at position {self._pos}")
+            self._key = self._decode_value()
+            self._state = _State.COLON
+        elif state is _State.COLON:
+            self._expect(":")
+            self._state = _State.VALUE
+        elif state is _State.VALUE:
+            if self._key == self.RESULTS_KEY:
+                self._expect("[")
+                self._has_results = True
+                self._state = _State.RESULT_OR_END
+            else:
+                self._fields[self._key] = self._decode_value()
+                self._state = _State.VALUE_END
+        elif state is _State.VALUE_END:
+            if self._accept(","):
+                self._state = _State.KEY
+            else:
+                self._expect("}")
+                self._state = _State.END
+        elif state in (_State.RESULT_OR_END, _State.RESULT):
+            if state is _State.RESULT_OR_END and self._accept("]"):
+                self._state = _State.VALUE_END
+                return
+            if not (
+                self._validate_complete_results(results)
+                or self._decode_complete_results(results)
+            ):
+                results.append(self._decode_value())
+                self._state = _State.RESULT_END
+        elif state is _State.RESULT_END:
+            if self._accept(","):
+                self._state = _State.RESULT
+            else:
+                self._expect("]")
+                self._state = _State.VALUE_END
+
+    def _validate_complete_results(self, results: list[Any]) -> bool:
+        """Decodes and validates the results up to the last result end in the buffer.
+
+        This is the fast path of the decoder: the results are parsed by pydantic
+        (`validate_json()`) instead of `json`, then validated from Python objects.
+        The last result end is found by searching for '}' followed by ',' or ']'
+        with as many '{' as '}' before it, which may still be inside a string.
+        In such cases the slice isn't valid JSON, then this returns False and
+        `_decode_complete_results()` needs to decode the results.
+        """
+        buffer = self._buffer
+        end = len(buffer)
+        while (end := buffer.rfind("}", self._pos, end)) != -1:
+            if not (match := RESULT_END.match(buffer, end)):
+                continue
+            # Skip the ends of nested objects (e.g., "license") of the last result,
+            # which is incomplete.
+            results_json = buffer[self._pos : end + 1]
+            if results_json.count("{") == results_json.count("}"):
+                break
+        else:
+            return False
+
+        try:
+            validated = RESULTS_ADAPTER.validate_json(f"[{results_json}]")
+        except ValidationError:
+            return False
+
+        results.extend(validated)
+        self._pos = match.end()
+        self._state = _State.VALUE_END if match[1] == "]" else _State.RESULT
+        return True
+
+    def _decode_complete_results(self, results: list[Any]) -> bool:
+        """Decodes every result that is followed by ',' or ']' in the buffer.
+
+        This avoids going through `_step()` for each token. Returns whether any result was decoded, if none were then
+        `_step()` needs to decode the result.
+        """
+        buffer = self._buffer
+        buffer_size = len(buffer)
+        match_whitespace = WHITESPACE.match
+        raw_decode = self._json_decoder.raw_decode
+
+        pos = self._pos
+        decoded = False
+        while True:
+            try:
+                value, end = raw_decode(buffer, match_whitespace(buffer, pos).end())
+            except json.JSONDecodeError:
+                break
+            end = match_whitespace(buffer, end).end()
+            if end >= buffer_size:
+                break
+            separator = buffer[end]
+            if separator not in ",]":
+                break
+
+            results.append(value)
+            decoded = True
+            pos = end + 1
+            if separator == "]":
+                self._state = _State.VALUE_END
+                break
+            self._state = _State.RESULT
+
+        self._pos = pos
+        return decoded
+
+    def _skip_whitespace(self) -> None:
+        self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+
+    def _peek(self) -> str:
+        """Returns the next non-whitespace character."""
+        self._skip_whitespace()
+        if self._pos >= len(self._buffer):
+            if self._eof:
+                raise ValueError("Unexpected end of input")
+            raise _NeedMoreData
+        return self._buffer[self._pos]
+
+    def _accept(self, char: str) -> bool:
+        """Consumes the next character if it matches."""
+        if self._peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def _expect(self, char: str) -> None:
+        if not self._accept(char):
+            raise ValueError(f"Expected {char!r} at position {self._pos}")
+
+    def _decode_value(self) -> Any:
+        self._peek()
+        try:
+            value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            # The value may be incomplete.
+            if self._eof:
+                raise
+            raise _NeedMoreData
+
+        # Numbers and literals may continue in the next chunk (e.g., '12' and '3').
+        if end == len(self._buffer) and not self._eof:
+            raise _NeedMoreData
+
+        self._pos = end
+        return value
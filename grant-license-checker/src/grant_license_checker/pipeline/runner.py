@@ -0,0 +1,150 @@
+"""
+Runs the reading, decoding and indexing of a grant JSON report as concurrent stages.
+
+    [reader] --chunks--> [decoder] --results--> [indexer] --> GrantResponse, index
+
+Stages are connected by bounded queues, thus a slow stage applies back-pressure
+instead of buffering the whole input in memory. The indexer runs in the calling
+thread so that rendering can start as soon as the index is sealed.
+
+Note: stages are threads sharing the GIL, thus decoding and indexing don't run in
+      parallel. This is only faster than decoding the whole input at once when
+      the input is produced slowly (e.g., piped from `grant check`), as the input
+      is decoded while waiting for the producer.
+"""
+import dataclasses
+import functools
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+from grant_license_checker.models.grant_json import GrantEvaluations, GrantResponse
+from grant_license_checker.pipeline.decoder import GrantResponseDecoder
+from grant_license_checker.renderers.index import LicenseIndex
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_QUEUE_SIZE = 16
+
+# Marks the end of a stage's output.
+_END = object()
+
+
+@dataclasses.dataclass
+class _StageError:
+    """Forwards an exception raised by a stage to the next stage."""
+
+    exc: BaseException
+
+
+def _put(out_queue: queue.Queue, item: Any, cancelled: threading.Event) -> None:
+    """Puts an item into a queue, gives up if the pipeline is cancelled."""
+    while not cancelled.is_set():
+        try:
+            out_queue.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def _iter_queue(in_queue: queue.Queue) -> Iterator[Any]:
+    """Yields the items of a stage, reraises the exception of the stage if any."""
+    while (item := in_queue.get()) is not _END:
+        if isinstance(item, _StageError):
+            raise item.exc
+        yield item
+
+
+def _run_stage(
+    produce: Callable[[], Iterable[Any]],
+    out_queue: queue.Queue,
+    cancelled: threading.Event,
+) -> None:
+    try:
+        for item in produce():
+            if cancelled.is_set():
+                return
+            _put(out_queue, item, cancelled)
+    except BaseException as exc:
+        _put(out_queue, _StageError(exc), cancelled)
+    else:
+        _put(out_queue, _END, cancelled)
+
+
+def read_chunks(input_fp: TextIO, chunk_size: int) -> Iterator[str]:
+    """Reads a file chunk by chunk until EOF."""
+    while chunk := input_fp.read(chunk_size):
+        yield chunk
+
+
+def decode_chunks(
+    chunks: Iterable[str], decoder: GrantResponseDecoder
+) -> Iterator[list[GrantEvaluations]]:
+    """Decodes chunks of a grant JSON report, yields the results per chunk."""
+    for chunk in chunks:
+        if results := decoder.feed(chunk):
+            yield results
+    if results := decoder.close():
+        yield results
+
+
+def run_pipeline(
+    input_fp: TextIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> tuple[GrantResponse, LicenseIndex]:
+    """Reads and decodes a grant JSON report, and groups its packages by license.
+
+    Returns the report, and the sealed index (see `LicenseIndex.seal()`).
+
+    Raises:
+        - OSError if the input failed to be read,
+        - ValueError if the input is invalid.
+    """
+    cancelled = threading.Event()
+    chunk_queue = queue.Queue(maxsize=queue_size)
+    result_queue = queue.Queue(maxsize=queue_size)
+    decoder = GrantResponseDecoder()
+
+    stages = [
+        threading.Thread(
+            name="grant-reader",
+            target=_run_stage,
+            args=(
+                functools.partial(read_chunks, input_fp, chunk_size),
+                chunk_queue,
+                cancelled,
+            ),
+            daemon=True,
+        ),
+        threading.Thread(
+            name="grant-decoder",
+            target=_run_stage,
+            args=(
+                lambda: decode_chunks(_iter_queue(chunk_queue), decoder),
+                result_queue,
+                cancelled,
+            ),
+            daemon=True,
+        ),
+    ]
+    for stage in stages:
+        stage.start()
+
+    index = LicenseIndex()
+    results: list[GrantEvaluations] = []
+    try:
+        for batch in _iter_queue(result_queue):
+            results.extend(batch)
+            for eval_result in batch:
+                index.add(eval_result)
+    except BaseException:
+        # Unblock the stages, they are not joined as the reader may be blocked
+        # reading from stdin.
+        cancelled.set()
+        raise
+
+    for stage in stages:
+        stage.join()
+
+    index.seal()
+    return decoder.get_response(results), index
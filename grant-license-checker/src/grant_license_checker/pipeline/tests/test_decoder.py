@@ -0,0 +1,75 @@
+import pytest
+
+from grant_license_checker.conftest import get_fixture
+from grant_license_checker.models.grant_json import GrantResponse
+from grant_license_checker.pipeline.decoder import GrantResponseDecoder
+
+
+def decode(raw: str, chunk_size: int) -> GrantResponse:
+    decoder = GrantResponseDecoder()
+    results = []
+    for start in range(0, len(raw), chunk_size):
+        results.extend(decoder.feed(raw[start : start + chunk_size]))
+    results.extend(decoder.close())
+    return decoder.get_response(results)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1024 * 1024])
+def test_decode_in_chunks(chunk_size, grant_json_report):
+    """Decoding chunk by chunk should return the same report as pydantic."""
+    raw = get_fixture("sample-grant-report.json").read_text()
+
+    assert decode(raw, chunk_size) == grant_json_report
+
+
+def test_decode_yields_results_as_soon_as_complete():
+    decoder = GrantResponseDecoder()
+    result = (
+        '{"license": {"name": "", "license_id": "MIT", "spdx_expression": ""},'
+        ' "package": {"name": "foo", "type": "npm"}}'
+    )
+
+    assert decoder.feed('{"results": [' + result[:10]) == []
+    assert len(decoder.feed(result[10:] + ",")) == 1
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1024 * 1024])
+def test_decode_results_with_brackets_in_strings(chunk_size):
+    """Names looking like the end of a result should not break the fast path."""
+    results = ",\n".join(
+        '{"license": {"name": "' + name + '", "license_id": "", "spdx_expression": ""},'
+        ' "package": {"name": "' + name + '", "type": "npm"}}'
+        for name in ["a}, {", "b}]", "{c", "d}", "e"] * 20
+    )
+    raw = '{"timestamp": "", "inputs": [], "results": [' + results + "]}"
+
+    assert decode(raw, chunk_size) == GrantResponse.model_validate_json(raw)
+
+
+def test_decode_empty_results():
+    raw = '{"timestamp": "", "inputs": ["./bom.json"], "results": []}'
+
+    assert decode(raw, chunk_size=3) == GrantResponse.model_validate_json(raw)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        # Incomplete input
+        '{"timestamp": "", "inputs": [], "results": [',
+        '{"timestamp": "", "inputs": [], "results": []',
+        # Extra data
+        '{"timestamp": "", "inputs": [], "results": []}}',
+        # Invalid results
+        '{"timestamp": "", "inputs": [], "results": {}}',
+        '{"timestamp": "", "inputs": [], "results": [1]}',
+        '{"timestamp": "", "inputs": [], "results": [{}, ]}',
+        # Missing results
+        '{"timestamp": "", "inputs": []}',
+        # Not an object
+        "[]",
+    ],
+)
+def test_decode_invalid_input(raw):
+    with pytest.raises(ValueError):
+        decode(raw, chunk_size=4)
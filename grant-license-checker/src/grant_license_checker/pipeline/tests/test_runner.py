@@ -0,0 +1,37 @@
+import io
+
+import pytest
+
+from grant_license_checker.conftest import get_fixture
+from grant_license_checker.pipeline.runner import run_pipeline
+from grant_license_checker.renderers import BaseRenderer
+
+
+@pytest.mark.parametrize("chunk_size,queue_size", [(1, 1), (16, 2), (64 * 1024, 16)])
+def test_run_pipeline(grant_json_report, chunk_size, queue_size):
+    """The pipeline should return the same report and grouping as BaseRenderer."""
+    input_fp = io.StringIO(get_fixture("sample-grant-report.json").read_text())
+
+    data, index = run_pipeline(input_fp, chunk_size=chunk_size, queue_size=queue_size)
+
+    assert data == grant_json_report
+    renderer = BaseRenderer(data=data, list_packages=True, max_package_count=-1)
+    assert (index.seal(), index.get_packages_with_multiple_licenses()) == (
+        renderer.group_results()
+    )
+
+
+def test_run_pipeline_reraises_decoding_errors():
+    input_fp = io.StringIO('{"timestamp": "", "inputs": [], "results": [1]}')
+
+    with pytest.raises(ValueError):
+        run_pipeline(input_fp, chunk_size=4, queue_size=1)
+
+
+def test_run_pipeline_reraises_reading_errors():
+    class BrokenFile(io.StringIO):
+        def read(self, *args, **kwargs):
+            raise OSError("broken pipe")
+
+    with pytest.raises(OSError, match="broken pipe"):
+        run_pipeline(BrokenFile())
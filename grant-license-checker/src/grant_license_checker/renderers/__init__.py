@@ -1,10 +1,25 @@
-from grant_license_checker.renderers.base import BaseRenderer
-from grant_license_checker.renderers.html import HTMLRenderer
+from grant_license_checker.renderers.base import REPORTS, BaseRenderer
+from grant_license_checker.renderers.html import CompiledHTMLRenderer, HTMLRenderer
+from grant_license_checker.renderers.index import LicenseIndex
 from grant_license_checker.renderers.tsv import TSVRenderer
-from grant_license_checker.renderers.tty import TTYRenderer
+from grant_license_checker.renderers.tty import CompiledTTYRenderer, TTYRenderer
 
 RENDERERS: dict[str, type[BaseRenderer]] = {
     "html": HTMLRenderer,
     "tty": TTYRenderer,
     "tsv": TSVRenderer,
 }
+
+# Renderers producing the same output as RENDERERS without using Jinja2 templates
+# (faster for large reports).
+COMPILED_RENDERERS: dict[str, type[BaseRenderer]] = {
+    "html": CompiledHTMLRenderer,
+    "tty": CompiledTTYRenderer,
+    "tsv": TSVRenderer,
+}
+
+# Maps a rendering engine name to its renderers (see '--engine').
+RENDERING_ENGINES: dict[str, dict[str, type[BaseRenderer]]] = {
+    "jinja": RENDERERS,
+    "compiled": COMPILED_RENDERERS,
+}
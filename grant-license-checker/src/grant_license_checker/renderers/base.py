@@ -1,10 +1,93 @@
 import dataclasses
-from collections import defaultdict
-from typing import DefaultDict, TextIO
+from typing import Callable, Iterator, TextIO
 
 import jinja2
 
-from grant_license_checker.models.grant_json import GrantPackage, GrantResponse
+from grant_license_checker.models.grant_json import GrantResponse
+from grant_license_checker.renderers.index import (
+    LicenseIndex,
+    LicensesByPackage,
+    PackagesByLicense,
+)
+
+# List of (group name, item names) pairs to render,
+# e.g., (license name, package names).
+ReportRows = list[tuple[str, list[str]]]
+
+# Records for machine-readable formats, one per item (see `Report.columns`).
+ReportRecords = Iterator[tuple[str, ...]]
+
+
+@dataclasses.dataclass(frozen=True)
+class Report:
+    # Column titles, e.g., "License Name", "Package Count" and "Packages".
+    group_title: str
+    count_title: str
+    items_title: str
+
+    # The singular name of an item, e.g., "package".
+    item_name: str
+
+    # The column names for machine-readable formats, e.g., ("license", "package").
+    columns: tuple[str, ...]
+
+    # Return the rows to render, and the records for machine-readable formats
+    # given the renderer (and thus its grouped results).
+    get_rows: Callable[["BaseRenderer"], ReportRows]
+    get_records: Callable[["BaseRenderer"], ReportRecords]
+
+
+def _get_license_rows(renderer: "BaseRenderer") -> ReportRows:
+    return [
+        (license_name, [pkg.name for pkg in packages])
+        for license_name, packages in renderer.get_packages_grouped_by_license()
+    ]
+
+
+def _get_license_records(renderer: "BaseRenderer") -> ReportRecords:
+    for license_name, packages in renderer.get_packages_grouped_by_license():
+        for package in packages:
+            yield license_name, package.name
+
+
+def _get_multi_license_rows(renderer: "BaseRenderer") -> ReportRows:
+    return [
+        (f"{package.name} ({package.type})", licenses)
+        for package, licenses in renderer.get_packages_with_multiple_licenses()
+    ]
+
+
+def _get_multi_license_records(renderer: "BaseRenderer") -> ReportRecords:
+    # The package name and type are separate columns, unlike the rows
+    # (e.g., 'Django (python)').
+    for package, licenses in renderer.get_packages_with_multiple_licenses():
+        for license_name in licenses:
+            yield package.name, package.type, license_name
+
+
+REPORTS: dict[str, Report] = {
+    # Packages grouped by license.
+    "licenses": Report(
+        group_title="License Name",
+        count_title="Package Count",
+        items_title="Packages",
+        item_name="package",
+        columns=("license", "package"),
+        get_rows=_get_license_rows,
+        get_records=_get_license_records,
+    ),
+    # Packages found under multiple (potentially conflicting) licenses,
+    # with their licenses.
+    "multi-license": Report(
+        group_title="Package Name",
+        count_title="License Count",
+        items_title="Licenses",
+        item_name="license",
+        columns=("package", "type", "license"),
+        get_rows=_get_multi_license_rows,
+        get_records=_get_multi_license_records,
+    ),
+}
 
 
 @dataclasses.dataclass
@@ -16,29 +99,59 @@ class BaseRenderer:
     list_packages: bool
     max_package_count: int
 
-    def get_packages_grouped_by_license(self) -> list[tuple[str, list[GrantPackage]]]:
-        packages_by_licence: DefaultDict[str, list[GrantPackage]] = defaultdict(list)
-        for eval_result in sorted(
-            self.data.results,
-            # Transform to lower-case for alphabetic ordering as it makes it
-            # more natural for humans (e.g., 'D' is 0x44, which is lower than 'a' (0x61)).
-            key=lambda o: (o.license.get_license_name().lower(), o.package.name.lower()),
-        ):
-            licenses = packages_by_licence[eval_result.license.get_license_name()]
-
-            # Do not append if it's a duplicate, cdxgen can generate many duplicates
-            # in the NPM ecosystem.
-            if eval_result.package not in licenses:
-                licenses.append(eval_result.package)
-
-        # Sort by package count (ascending)
-        sorted_list = sorted(
-            packages_by_licence.items(),
-            # - o[1] is the package count
-            # - o[0] is the license name (2nd key that ensures consistent sorting)
-            key=lambda o: (len(o[1]), o[0]),
-        )
-        return sorted_list
+    # `packages_by_license`, `multi_license_packages`: the results already grouped
+    # (e.g., using LicenseIndex), they are grouped from `data` when undefined.
+    packages_by_license: PackagesByLicense | None = None
+    multi_license_packages: LicensesByPackage | None = None
+
+    # `report`: which report to render (one of: REPORTS).
+    report: str = "licenses"
+
+    # The result of `group_results()`, computed once.
+    _grouped_results: tuple[PackagesByLicense, LicensesByPackage] | None = (
+        dataclasses.field(default=None, init=False, repr=False, compare=False)
+    )
+
+    def group_results(self) -> tuple[PackagesByLicense, LicensesByPackage]:
+        """Groups packages by license, and licenses by package in a single pass.
+
+        The result is cached, `data` must not be modified afterward.
+
+        Returns:
+            - the packages grouped by license (see `LicenseIndex.seal()`),
+            - the packages that have multiple licenses
+              (see `LicenseIndex.get_packages_with_multiple_licenses()`).
+        """
+        if self._grouped_results is None:
+            index = LicenseIndex()
+            for eval_result in self.data.results:
+                index.add(eval_result)
+            self._grouped_results = (
+                index.seal(),
+                index.get_packages_with_multiple_licenses(),
+            )
+        return self._grouped_results
+
+    def get_packages_grouped_by_license(self) -> PackagesByLicense:
+        if self.packages_by_license is not None:
+            return self.packages_by_license
+        return self.group_results()[0]
+
+    def get_packages_with_multiple_licenses(self) -> LicensesByPackage:
+        if self.multi_license_packages is not None:
+            return self.multi_license_packages
+        return self.group_results()[1]
+
+    def get_report(self) -> Report:
+        return REPORTS[self.report]
+
+    def get_report_rows(self) -> ReportRows:
+        """Returns the names to render for the selected report."""
+        return self.get_report().get_rows(self)
+
+    def get_report_records(self) -> ReportRecords:
+        """Returns the records of the selected report (see `Report.columns`)."""
+        return self.get_report().get_records(self)
 
     @staticmethod
     def create_jinja_template() -> jinja2.Template:
@@ -46,10 +159,10 @@ class BaseRenderer:
 
     def render(self, output_fp: TextIO) -> None:
         tpl = self.create_jinja_template()
-        package_list = self.get_packages_grouped_by_license()
 
         for part in tpl.generate(
-            sorted_list=package_list,
+            sorted_list=self.get_report_rows(),
+            report=self.get_report(),
             list_packages=self.list_packages,
             max_package_count=self.max_package_count,
             data=self.data,
@@ -1,4 +1,8 @@
+import functools
+from typing import TextIO
+
 import jinja2
+import markupsafe
 
 from grant_license_checker.renderers.base import BaseRenderer
 
@@ -8,23 +12,23 @@ HTML_TEMPLATE = """
     <tr>
         {# Width is needed due to SPDX expressions being long
            otherwise they take the whole space, which decreases readability. #}
-        <th width='200px'>License Name</th>
-        <th>Package Count</th>
-        {% if list_packages %}<th>Packages</th>{% endif %}
+        <th width='200px'>{{ report.group_title }}</th>
+        <th>{{ report.count_title }}</th>
+        {% if list_packages %}<th>{{ report.items_title }}</th>{% endif %}
     </tr>
-    {% for license_name, package_list in sorted_list %}
+    {% for group_name, item_list in sorted_list %}
     <tr>
-        <td>{{ license_name }}</td>
-        <td>{{ package_list | length }}</td>
+        <td>{{ group_name }}</td>
+        <td>{{ item_list | length }}</td>
         {% if list_packages %}
             <td>
                 <details>
-                    <summary>Packages</summary>
+                    <summary>{{ report.items_title }}</summary>
                     <ul>
-                        {% for pkg in package_list %}
+                        {% for item in item_list %}
                         {% if max_package_count >= 0 and loop.index0 > max_package_count - 1 %}
-                            {# Truncate packages if there are too many. -#}
-                            {% set remain = (package_list | length) - loop.index0 %}
+                            {# Truncate items if there are too many. -#}
+                            {% set remain = (item_list | length) - loop.index0 %}
                             <li>
                                 <i>
                                     And {{ remain }} more...
@@ -32,7 +36,7 @@ HTML_TEMPLATE = """
                             </li>
                             {% break %}
                         {% endif %}
-                        <li>{{ pkg.name }}</li>
+                        <li>{{ item }}</li>
                         {% endfor %}
                     </ul>
                 </details>
@@ -54,3 +58,74 @@ class HTMLRenderer(BaseRenderer):
             extensions=["jinja2.ext.loopcontrols"],
         )
         return jinja_env.from_string(HTML_TEMPLATE)
+
+
+@functools.lru_cache(maxsize=None)
+def escape_html(value: str) -> str:
+    """Escapes a string the same way as Jinja2's autoescape.
+
+    Results are cached as the same names are repeated across licenses and packages.
+    """
+    return str(markupsafe.escape(value))
+
+
+class CompiledHTMLRenderer(HTMLRenderer):
+    """
+    Renders the same output as `HTML_TEMPLATE` without using Jinja2.
+
+    It is faster for large package lists, any change to `HTML_TEMPLATE` must be
+    reflected here.
+    """
+
+    def render(self, output_fp: TextIO) -> None:
+        report = self.get_report()
+        items_title = escape_html(report.items_title)
+
+        output_fp.write(
+            "\n<table>\n"
+            "    <tr>\n"
+            f"        <th width='200px'>{escape_html(report.group_title)}</th>\n"
+            f"        <th>{escape_html(report.count_title)}</th>\n"
+        )
+        if self.list_packages:
+            output_fp.write(f"<th>{items_title}</th>")
+        output_fp.write("    </tr>\n")
+
+        for group_name, items in self.get_report_rows():
+            chunks = [
+                "    <tr>\n"
+                f"        <td>{escape_html(group_name)}</td>\n"
+                f"        <td>{len(items)}</td>\n"
+            ]
+            if self.list_packages:
+                chunks.append(
+                    "            <td>\n"
+                    "                <details>\n"
+                    f"                    <summary>{items_title}</summary>\n"
+                    "                    <ul>\n"
+                )
+                shown = items
+                if 0 <= self.max_package_count < len(items):
+                    shown = items[: self.max_package_count]
+                chunks.extend(
+                    f"                        <li>{escape_html(item)}</li>\n"
+                    for item in shown
+                )
+                if remain := len(items) - len(shown):
+                    # Truncate items if there are too many.
+                    chunks.append(
+                        "                            <li>\n"
+                        "                                <i>\n"
+                        f"                                    And {remain} more...\n"
+                        "                                </i>\n"
+                        "                            </li>\n"
+                    )
+                chunks.append(
+                    "                    </ul>\n"
+                    "                </details>\n"
+                    "            </td>\n"
+                )
+            chunks.append("    </tr>\n")
+            output_fp.write("".join(chunks))
+
+        output_fp.write("</table>")
@@ -0,0 +1,94 @@
+from grant_license_checker.models.grant_json import GrantEvaluations, GrantPackage
+
+# List of (license name, packages) pairs.
+PackagesByLicense = list[tuple[str, list[GrantPackage]]]
+
+# List of (package, license names) pairs.
+LicensesByPackage = list[tuple[GrantPackage, list[str]]]
+
+
+def get_packages_with_multiple_licenses(
+    licenses_by_package: dict[tuple[str, str], tuple[GrantPackage, list[str]]],
+) -> LicensesByPackage:
+    """Returns the packages that have more than one license.
+
+    Sorted in ascending order by license count, then by package name and type.
+    """
+    return sorted(
+        (entry for entry in licenses_by_package.values() if len(entry[1]) > 1),
+        key=lambda o: (len(o[1]), o[0].name.lower(), o[0].name, o[0].type),
+    )
+
+
+class LicenseIndex:
+    """
+    Groups packages by license incrementally, e.g., as results are being decoded.
+
+    This is the reference grouping implementation, `BaseRenderer.group_results()`
+    uses it as well.
+    """
+
+    def __init__(self) -> None:
+        # Maps a license name to its packages, in order of appearance.
+        # The inner dict deduplicates packages by (name, type) which is
+        # the same as comparing GrantPackage objects.
+        self._packages_by_license: dict[str, dict[tuple[str, str], GrantPackage]] = {}
+        # Inverse index, maps (package name, type) to the package and its licenses.
+        self._licenses_by_package: dict[
+            tuple[str, str], tuple[GrantPackage, list[str]]
+        ] = {}
+        self._sealed: PackagesByLicense | None = None
+
+    def add(self, eval_result: GrantEvaluations) -> None:
+        if self._sealed is not None:
+            raise RuntimeError("Cannot add results to a sealed index")
+
+        package = eval_result.package
+        package_key = (package.name, package.type)
+        license_name = eval_result.license.get_license_name()
+        packages = self._packages_by_license.setdefault(license_name, {})
+
+        # Skip if it's a duplicate, cdxgen can generate many duplicates
+        # in the NPM ecosystem.
+        if package_key in packages:
+            return
+
+        packages[package_key] = package
+        self._licenses_by_package.setdefault(package_key, (package, []))[1].append(
+            license_name
+        )
+
+    def seal(self) -> PackagesByLicense:
+        """Returns the packages grouped by license, no results can be added afterwards.
+
+        Ordering:
+            - Packages are sorted by name (case-insensitive),
+            - Licenses are sorted by package count, then by name.
+        """
+        if self._sealed is None:
+            self._sealed = sorted(
+                (
+                    (
+                        license_name,
+                        # Sorting is stable, thus packages with the same name keep
+                        # their order of appearance.
+                        sorted(packages.values(), key=lambda o: o.name.lower()),
+                    )
+                    for license_name, packages in self._packages_by_license.items()
+                ),
+                key=lambda o: (len(o[1]), o[0]),
+            )
+
+            # Licenses are sorted by name (case-insensitive), the sorting
+            # is stable thus ties keep their order of appearance.
+            for _, licenses in self._licenses_by_package.values():
+                licenses.sort(key=str.lower)
+        return self._sealed
+
+    def get_packages_with_multiple_licenses(self) -> LicensesByPackage:
+        """Returns the packages that have more than one license (seals the index).
+
+        Licenses are sorted by name (case-insensitive).
+        """
+        self.seal()
+        return get_packages_with_multiple_licenses(self._licenses_by_package)
@@ -31,3 +31,24 @@ def test_get_packages_grouped_by_license(grant_json_report):
             ],
         ),
     ]
+
+
+def test_get_packages_with_multiple_licenses(grant_json_report):
+    renderer = BaseRenderer(
+        data=grant_json_report, list_packages=False, max_package_count=-1
+    )
+
+    # Should be sorted in ascending order by the following keys:
+    # - Number of licenses per package,
+    # - Package name (case-insensitive).
+    assert renderer.get_packages_with_multiple_licenses() == [
+        (GrantPackage(name="asgiref", type="python"), ["0BSD", "BSD-3-Clause"]),
+        (GrantPackage(name="Django", type="python"), ["0BSD", "BSD-3-Clause"]),
+    ]
+
+    # Both groupings should be computed by the same (cached) pass.
+    assert renderer.group_results() is renderer.group_results()
+    assert renderer.group_results() == (
+        renderer.get_packages_grouped_by_license(),
+        renderer.get_packages_with_multiple_licenses(),
+    )
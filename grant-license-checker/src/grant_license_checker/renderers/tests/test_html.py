@@ -1,17 +1,25 @@
 from io import StringIO
 
+import pytest
+
 from grant_license_checker.models.grant_json import (
     GrantResponse,
     GrantLicense,
     GrantEvaluations,
     GrantPackage,
 )
-from grant_license_checker.renderers import HTMLRenderer
+from grant_license_checker.renderers import CompiledHTMLRenderer, HTMLRenderer
+
+# The compiled renderer must render the exact same output as the template.
+parametrize_renderers = pytest.mark.parametrize(
+    "renderer_cls", [HTMLRenderer, CompiledHTMLRenderer]
+)
 
 
-def test_get_html_summary_without_package_list(grant_json_report):
+@parametrize_renderers
+def test_get_html_summary_without_package_list(grant_json_report, renderer_cls):
     """Checks the HTML summary output is as expected when list_packages=False."""
-    renderer = HTMLRenderer(
+    renderer = renderer_cls(
         data=grant_json_report, list_packages=False, max_package_count=-1
     )
 
@@ -40,9 +48,10 @@ def test_get_html_summary_without_package_list(grant_json_report):
 </table>"""
 
 
-def test_get_html_summary_with_package_list(grant_json_report):
+@parametrize_renderers
+def test_get_html_summary_with_package_list(grant_json_report, renderer_cls):
     """Checks the HTML summary output is as expected when list_packages=True."""
-    renderer = HTMLRenderer(
+    renderer = renderer_cls(
         data=grant_json_report, list_packages=True, max_package_count=2
     )
 
@@ -107,7 +116,8 @@ def test_get_html_summary_with_package_list(grant_json_report):
 </table>"""
 
 
-def test_html_is_sanitized():
+@parametrize_renderers
+def test_html_is_sanitized(renderer_cls):
     """Ensures HTML in untrusted inputs are sanitized correctly."""
     grant_json_report = GrantResponse(
         inputs=[],
@@ -121,7 +131,7 @@ def test_html_is_sanitized():
             ),
         ],
     )
-    renderer = HTMLRenderer(
+    renderer = renderer_cls(
         data=grant_json_report, list_packages=True, max_package_count=2
     )
 
@@ -150,3 +160,34 @@ def test_html_is_sanitized():
     </tr>
 </table>"""
     )
+
+
+@parametrize_renderers
+def test_get_html_multi_license_report(grant_json_report, renderer_cls):
+    """Checks the HTML output is as expected when report='multi-license'."""
+    renderer = renderer_cls(
+        data=grant_json_report,
+        list_packages=False,
+        max_package_count=-1,
+        report="multi-license",
+    )
+
+    out_fp = StringIO()
+    renderer.render(out_fp)
+
+    # Should only list packages that have multiple licenses.
+    output = out_fp.getvalue().strip()
+    assert output == """<table>
+    <tr>
+        <th width='200px'>Package Name</th>
+        <th>License Count</th>
+    </tr>
+    <tr>
+        <td>asgiref (python)</td>
+        <td>2</td>
+    </tr>
+    <tr>
+        <td>Django (python)</td>
+        <td>2</td>
+    </tr>
+</table>"""
@@ -0,0 +1,56 @@
+import pytest
+
+from grant_license_checker.models.grant_json import (
+    GrantEvaluations,
+    GrantLicense,
+    GrantPackage,
+)
+from grant_license_checker.renderers import LicenseIndex
+
+
+def make_result(license_id: str, name: str, type: str = "npm") -> GrantEvaluations:
+    return GrantEvaluations(
+        license=GrantLicense(name="", license_id=license_id, spdx_expression=""),
+        package=GrantPackage(name=name, type=type),
+    )
+
+
+def test_license_index_ordering_and_duplicates():
+    """Duplicates are removed, case-insensitive ties keep their order of appearance."""
+    results = [
+        make_result("MIT", "b"),
+        make_result("mit", "a"),
+        make_result("MIT", "B"),
+        make_result("MIT", "b"),
+        make_result("MIT", "b", type="pypi"),
+        make_result("MIT", "A"),
+        make_result("0BSD", "c"),
+        make_result("0BSD", "b"),
+        make_result("mit", "b"),
+    ]
+    index = LicenseIndex()
+    for eval_result in results:
+        index.add(eval_result)
+
+    # Licenses are sorted by package count then name, packages by name.
+    assert [
+        (license_name, [(pkg.name, pkg.type) for pkg in packages])
+        for license_name, packages in index.seal()
+    ] == [
+        ("0BSD", [("b", "npm"), ("c", "npm")]),
+        ("mit", [("a", "npm"), ("b", "npm")]),
+        ("MIT", [("A", "npm"), ("b", "npm"), ("B", "npm"), ("b", "pypi")]),
+    ]
+
+    # 'b' (npm) has multiple licenses, including two that only differ by case.
+    assert index.get_packages_with_multiple_licenses() == [
+        (GrantPackage(name="b", type="npm"), ["0BSD", "MIT", "mit"]),
+    ]
+
+
+def test_license_index_cannot_be_modified_once_sealed():
+    index = LicenseIndex()
+    index.seal()
+
+    with pytest.raises(RuntimeError):
+        index.add(make_result("MIT", "a"))
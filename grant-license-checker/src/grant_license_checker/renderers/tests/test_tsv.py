@@ -0,0 +1,45 @@
+from io import StringIO
+
+import pytest
+
+from grant_license_checker.renderers import TSVRenderer
+
+
+@pytest.mark.parametrize(
+    "report,expected",
+    [
+        (
+            "licenses",
+            [
+                "license\tpackage",
+                "Apache-2.0\ttzdata",
+                "0BSD\tasgiref",
+                "0BSD\tDjango",
+                "0BSD\tsqlparse",
+                "BSD-3-Clause\tasgiref",
+                "BSD-3-Clause\tDjango",
+                "BSD-3-Clause\texample-project",
+            ],
+        ),
+        (
+            "multi-license",
+            [
+                "package\ttype\tlicense",
+                "asgiref\tpython\t0BSD",
+                "asgiref\tpython\tBSD-3-Clause",
+                "Django\tpython\t0BSD",
+                "Django\tpython\tBSD-3-Clause",
+            ],
+        ),
+    ],
+)
+def test_get_tsv_report(grant_json_report, report, expected):
+    """Checks the TSV output is as expected, truncation should be ignored."""
+    renderer = TSVRenderer(
+        data=grant_json_report, list_packages=True, max_package_count=1, report=report
+    )
+
+    out_fp = StringIO()
+    renderer.render(out_fp)
+
+    assert out_fp.getvalue().splitlines() == expected
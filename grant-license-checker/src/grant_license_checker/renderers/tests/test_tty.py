@@ -1,17 +1,25 @@
 from io import StringIO
 
+import pytest
+
 from grant_license_checker.models.grant_json import (
     GrantResponse,
     GrantLicense,
     GrantEvaluations,
     GrantPackage,
 )
-from grant_license_checker.renderers import TTYRenderer
+from grant_license_checker.renderers import CompiledTTYRenderer, TTYRenderer
+
+# The compiled renderer must render the exact same output as the template.
+parametrize_renderers = pytest.mark.parametrize(
+    "renderer_cls", [TTYRenderer, CompiledTTYRenderer]
+)
 
 
-def test_get_tty_summary_without_package_list(grant_json_report):
+@parametrize_renderers
+def test_get_tty_summary_without_package_list(grant_json_report, renderer_cls):
     """Checks the TTY summary output is as expected when list_packages=False."""
-    renderer = TTYRenderer(
+    renderer = renderer_cls(
         data=grant_json_report, list_packages=False, max_package_count=-1
     )
 
@@ -29,9 +37,10 @@ def test_get_tty_summary_without_package_list(grant_json_report):
     )
 
 
-def test_get_tty_summary_with_package_list(grant_json_report):
+@parametrize_renderers
+def test_get_tty_summary_with_package_list(grant_json_report, renderer_cls):
     """Checks the TTY summary output is as expected when list_packages=True."""
-    renderer = TTYRenderer(
+    renderer = renderer_cls(
         data=grant_json_report, list_packages=True, max_package_count=2
     )
 
@@ -56,7 +65,8 @@ def test_get_tty_summary_with_package_list(grant_json_report):
     )
 
 
-def test_ansi_escape_sequences_are_sanitized():
+@parametrize_renderers
+def test_ansi_escape_sequences_are_sanitized(renderer_cls):
     """Ensures ANSI escape sequences are sanitized correctly."""
     grant_json_report = GrantResponse(
         inputs=[],
@@ -70,7 +80,7 @@ def test_ansi_escape_sequences_are_sanitized():
             ),
         ]
     )
-    renderer = TTYRenderer(
+    renderer = renderer_cls(
         data=grant_json_report, list_packages=True, max_package_count=2
     )
 
@@ -85,3 +95,30 @@ def test_ansi_escape_sequences_are_sanitized():
         "\033[1m<<License: [1;31m>>\033[0m: 1 package\n"
         "└──<<Package: [224;71m>>"
     )
+
+
+@parametrize_renderers
+def test_get_tty_multi_license_report(grant_json_report, renderer_cls):
+    """Checks the TTY output is as expected when report='multi-license'."""
+    renderer = renderer_cls(
+        data=grant_json_report,
+        list_packages=True,
+        max_package_count=-1,
+        report="multi-license",
+    )
+
+    out_fp = StringIO()
+    renderer.render(out_fp)
+
+    # Should only list packages that have multiple licenses.
+    output = out_fp.getvalue().strip()
+    assert (
+        output
+        == """\
+\x1b[1masgiref (python)\x1b[0m: 2 licenses
+└──0BSD
+└──BSD-3-Clause
+\x1b[1mDjango (python)\x1b[0m: 2 licenses
+└──0BSD
+└──BSD-3-Clause"""
+    )
@@ -8,13 +8,9 @@ class TSVRenderer(BaseRenderer):
     dialect = csv.excel_tab
 
     def render(self, output_fp: TextIO) -> None:
-        package_list = self.get_packages_grouped_by_license()
-
         writer = csv.writer(output_fp, dialect=self.dialect)
-        writer.writerow(("license", "package"))  # Header
+        writer.writerow(self.get_report().columns)  # Header
 
         # Note: truncation is not supported for TSV renderer, it's meant for
         #       machine analysis rather than for human friendly output.
-        for license_name, package_list in package_list:
-            for pkg in package_list:
-                writer.writerow((license_name, pkg.name))
+        writer.writerows(self.get_report_records())
@@ -1,21 +1,24 @@
+import functools
+from typing import TextIO
+
 import jinja2
 
 from grant_license_checker.renderers.base import BaseRenderer
 
 
 TTY_TEMPLATE = """\
-{% for license_name, package_list in sorted_list %}
-{% set package_count = (package_list | length) %}
-\033[1m{{ license_name }}\033[0m: {{ package_count }} package{% if package_count > 1 %}s{% endif %}
+{% for group_name, item_list in sorted_list %}
+{% set item_count = (item_list | length) %}
+\033[1m{{ group_name }}\033[0m: {{ item_count }} {{ report.item_name }}{% if item_count > 1 %}s{% endif %}
 
 {% if list_packages %}
-    {%- for pkg in package_list -%}
-        {# Truncate packages if there are too many. -#}
+    {%- for item in item_list -%}
+        {# Truncate items if there are too many. -#}
         {%- if max_package_count >= 0 and loop.index0 > max_package_count - 1 -%}
-            └──[{{ (package_list | length) - loop.index0 }} more...]
+            └──[{{ (item_list | length) - loop.index0 }} more...]
             {% break %}
         {% endif -%}
-        └──{{ pkg.name }}
+        └──{{ item }}
     {% endfor %}
 {% endif %}
 {% endfor %}
@@ -50,3 +53,41 @@ class TTYRenderer(BaseRenderer):
             finalize=sanitize,
         )
         return jinja_env.from_string(TTY_TEMPLATE)
+
+
+@functools.lru_cache(maxsize=None)
+def sanitize_name(value: str) -> str:
+    """Cached version of `strip_control_codes()`.
+
+    Names are repeated across licenses and packages, thus caching avoids
+    translating them again.
+    """
+    return strip_control_codes(value)
+
+
+class CompiledTTYRenderer(TTYRenderer):
+    """
+    Renders the same output as `TTY_TEMPLATE` without using Jinja2.
+
+    It is faster for large package lists, any change to `TTY_TEMPLATE` must be
+    reflected here.
+    """
+
+    def render(self, output_fp: TextIO) -> None:
+        item_name = sanitize_name(self.get_report().item_name)
+
+        for group_name, items in self.get_report_rows():
+            item_count = len(items)
+            chunks = [
+                f"\033[1m{sanitize_name(group_name)}\033[0m: "
+                f"{item_count} {item_name}{'s' if item_count > 1 else ''}\n"
+            ]
+            if self.list_packages:
+                shown = items
+                if 0 <= self.max_package_count < item_count:
+                    shown = items[: self.max_package_count]
+                chunks.extend(f"└──{sanitize_name(item)}\n" for item in shown)
+                if remain := item_count - len(shown):
+                    # Truncate items if there are too many.
+                    chunks.append(f"└──[{remain} more...]\n")
+            output_fp.write("".join(chunks))
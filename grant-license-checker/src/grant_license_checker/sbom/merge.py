@@ -0,0 +1,125 @@
+"""
+Merges CycloneDX SBOMs generated separately (e.g., one per ecosystem) into one SBOM.
+
+Note: this module must only depend on the standard library and support Python 3.8+
+      as it is invoked by sbom-generator using the runner's Python, without installing
+      the project's dependencies.
+"""
+import uuid
+from typing import Any, Dict, Iterable, List, Optional
+
+CYCLONEDX_SPEC_VERSION = "1.6"
+
+# Type alias for a parsed CycloneDX JSON document.
+SBOM = Dict[str, Any]
+
+
+def get_component_key(component: Dict[str, Any]) -> str:
+    """Returns the key identifying a component across SBOMs.
+
+    The package URL is preferred, then the BOM reference. Otherwise, falls back to
+    the component's coordinates.
+    """
+    if purl := component.get("purl"):
+        return purl
+    if bom_ref := component.get("bom-ref"):
+        return bom_ref
+    return "/".join(
+        component.get(field) or "" for field in ("type", "group", "name", "version")
+    )
+
+
+def _extend_unique(target: List[Any], values: Iterable[Any]) -> None:
+    """Appends values to a list if they are not already present."""
+    for value in values:
+        if value not in target:
+            target.append(value)
+
+
+def _merge_root_component(metadata: Dict[str, Any], component: Dict[str, Any]) -> None:
+    """Adds the root component of another SBOM to the merged SBOM's root component.
+
+    The other root components are kept as sub-components of the merged root, otherwise
+    the dependencies referencing them would point to nothing.
+    """
+    if (root := metadata.get("component")) is None:
+        metadata["component"] = component
+        return
+
+    key = get_component_key(component)
+    sub_components = root.get("components") or []
+    if key == get_component_key(root) or any(
+        key == get_component_key(sub_component) for sub_component in sub_components
+    ):
+        return
+    metadata["component"] = {**root, "components": [*sub_components, component]}
+
+
+def _check_sbom(sbom: SBOM, source: str) -> None:
+    if sbom.get("bomFormat") != "CycloneDX":
+        raise ValueError(f"{source} is not a CycloneDX SBOM")
+    if (spec_version := sbom.get("specVersion")) != CYCLONEDX_SPEC_VERSION:
+        raise ValueError(
+            f"{source} uses CycloneDX {spec_version}, "
+            f"expected CycloneDX {CYCLONEDX_SPEC_VERSION}"
+        )
+
+
+def merge_sboms(sboms: Iterable[SBOM]) -> SBOM:
+    """Merges CycloneDX 1.6 SBOMs into a single SBOM.
+
+    - Components are deduplicated by package URL (see `get_component_key()`), the first
+      occurrence is kept. If it has no license, then the licenses of a duplicate
+      are used;
+    - Dependencies are merged by reference;
+    - The metadata is taken from the first SBOM, metadata properties are merged;
+    - The root components (`metadata.component`) of the other SBOMs are added to
+      the root component's sub-components.
+    """
+    merged: Optional[SBOM] = None
+    components: Dict[str, Dict[str, Any]] = {}
+    # Maps a reference to its dependencies (dict is used as an ordered set).
+    dependencies: Dict[str, Dict[str, None]] = {}
+
+    for index, sbom in enumerate(sboms):
+        _check_sbom(sbom, source=f"SBOM #{index}")
+
+        if merged is None:
+            merged = {
+                **sbom,
+                "serialNumber": f"urn:uuid:{uuid.uuid4()}",
+                "version": 1,
+                "metadata": {**sbom.get("metadata", {})},
+            }
+        else:
+            metadata = merged["metadata"]
+            if root_component := sbom.get("metadata", {}).get("component"):
+                _merge_root_component(metadata, root_component)
+            if properties := sbom.get("metadata", {}).get("properties"):
+                metadata["properties"] = list(metadata.get("properties", []))
+                _extend_unique(metadata["properties"], properties)
+            for field in ("services", "annotations"):
+                if values := sbom.get(field):
+                    merged[field] = list(merged.get(field, []))
+                    _extend_unique(merged[field], values)
+
+        for component in sbom.get("components", []):
+            key = get_component_key(component)
+            if (existing := components.get(key)) is None:
+                components[key] = component
+            elif not existing.get("licenses") and component.get("licenses"):
+                components[key] = {**existing, "licenses": component["licenses"]}
+
+        for dependency in sbom.get("dependencies", []):
+            depends_on = dependencies.setdefault(dependency["ref"], {})
+            depends_on.update(dict.fromkeys(dependency.get("dependsOn", [])))
+
+    if merged is None:
+        raise ValueError("Nothing to merge: no SBOM was provided")
+
+    merged["components"] = list(components.values())
+    merged["dependencies"] = [
+        {"ref": ref, "dependsOn": list(depends_on)}
+        for ref, depends_on in dependencies.items()
+    ]
+    return merged
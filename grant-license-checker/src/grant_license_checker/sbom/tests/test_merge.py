@@ -0,0 +1,128 @@
+import copy
+import json
+
+import pytest
+
+from grant_license_checker.conftest import get_fixture
+from grant_license_checker.sbom.merge import merge_sboms
+
+
+@pytest.fixture
+def sample_sbom() -> dict:
+    return json.loads(get_fixture("sample-sbom-v1.6.json").read_text())
+
+
+def split_sbom(sbom: dict, *purl_prefixes: str) -> list[dict]:
+    """Splits a SBOM into one SBOM per package URL prefix (e.g., one per ecosystem)."""
+    return [
+        {
+            **copy.deepcopy(sbom),
+            "components": [
+                component
+                for component in sbom["components"]
+                if component["purl"].startswith(prefix)
+            ],
+        }
+        for prefix in purl_prefixes
+    ]
+
+
+def test_merge_sboms_deduplicates_components(sample_sbom):
+    """Merging a SBOM with itself should not duplicate any component."""
+    merged = merge_sboms([sample_sbom, copy.deepcopy(sample_sbom)])
+
+    assert merged["components"] == sample_sbom["components"]
+    assert merged["dependencies"] == sample_sbom["dependencies"]
+    assert merged["metadata"] == sample_sbom["metadata"]
+    assert merged["specVersion"] == "1.6"
+    assert merged["serialNumber"] != sample_sbom["serialNumber"]
+
+
+def test_merge_sboms_unions_components(sample_sbom):
+    """Merging SBOMs of disjoint components should return every component."""
+    parts = split_sbom(
+        sample_sbom, "pkg:pypi/a", "pkg:pypi/d", "pkg:pypi/s", "pkg:pypi/t"
+    )
+    # Each component should be in exactly one part.
+    assert sum(len(part["components"]) for part in parts) == len(
+        sample_sbom["components"]
+    )
+
+    merged = merge_sboms(parts)
+
+    assert sorted(c["purl"] for c in merged["components"]) == sorted(
+        c["purl"] for c in sample_sbom["components"]
+    )
+
+
+def test_merge_sboms_fills_missing_licenses(sample_sbom):
+    """When a duplicate has licenses but the first occurrence doesn't, use them."""
+    unlicensed = copy.deepcopy(sample_sbom)
+    for component in unlicensed["components"]:
+        del component["licenses"]
+
+    merged = merge_sboms([unlicensed, sample_sbom])
+
+    assert [c["licenses"] for c in merged["components"]] == [
+        c["licenses"] for c in sample_sbom["components"]
+    ]
+
+
+def test_merge_sboms_merges_dependencies(sample_sbom):
+    first, second = copy.deepcopy(sample_sbom), copy.deepcopy(sample_sbom)
+    first["dependencies"] = [{"ref": "pkg:pypi/a@1", "dependsOn": ["pkg:pypi/b@1"]}]
+    second["dependencies"] = [
+        {"ref": "pkg:pypi/a@1", "dependsOn": ["pkg:pypi/b@1", "pkg:pypi/c@1"]}
+    ]
+
+    assert merge_sboms([first, second])["dependencies"] == [
+        {"ref": "pkg:pypi/a@1", "dependsOn": ["pkg:pypi/b@1", "pkg:pypi/c@1"]}
+    ]
+
+
+def get_bom_refs(components: list[dict]) -> set[str]:
+    """Returns the BOM references of components, including their sub-components."""
+    refs = set()
+    for component in components:
+        refs.add(component["bom-ref"])
+        refs |= get_bom_refs(component.get("components") or [])
+    return refs
+
+
+def test_merge_sboms_keeps_root_components(sample_sbom):
+    """Root components of other SBOMs should remain referenced by dependencies."""
+    npm_root = {
+        "type": "application",
+        "name": "example-project",
+        "purl": "pkg:npm/example-project@0.1.0",
+        "bom-ref": "pkg:npm/example-project@0.1.0",
+    }
+    npm_sbom = {
+        **sample_sbom,
+        "metadata": {**sample_sbom["metadata"], "component": npm_root},
+        "components": [],
+        "dependencies": [{"ref": npm_root["bom-ref"], "dependsOn": []}],
+    }
+
+    merged = merge_sboms([sample_sbom, npm_sbom, npm_sbom])
+
+    root = merged["metadata"]["component"]
+    assert root["bom-ref"] == sample_sbom["metadata"]["component"]["bom-ref"]
+    assert root["components"] == [npm_root]
+    # Every dependency should reference a component of the merged SBOM.
+    refs = get_bom_refs([root, *merged["components"]])
+    assert {dependency["ref"] for dependency in merged["dependencies"]} <= refs
+    # Inputs should not be modified.
+    assert "components" not in sample_sbom["metadata"]["component"]
+
+
+def test_merge_sboms_rejects_other_spec_versions(sample_sbom):
+    sample_sbom["specVersion"] = "1.5"
+
+    with pytest.raises(ValueError, match="expected CycloneDX 1.6"):
+        merge_sboms([sample_sbom])
+
+
+def test_merge_sboms_without_input():
+    with pytest.raises(ValueError, match="no SBOM was provided"):
+        merge_sboms([])
@@ -0,0 +1,160 @@
+"""
+Generates synthetic grant JSON reports of arbitrary sizes for testing at scale.
+
+Reports are deterministic for a given size and seed, and contain the edge cases
+found in real reports:
+    - duplicate results (cdxgen generates many duplicates in the NPM ecosystem),
+    - packages under multiple licenses,
+    - packages sharing a name across ecosystems, or only differing by case,
+    - license names only differing by case,
+    - SPDX expressions, non-SPDX licenses, and missing licenses,
+    - names containing HTML and ANSI escape sequences.
+"""
+import json
+import random
+from typing import Any
+
+from grant_license_checker.models.grant_json import GrantResponse
+
+ECOSYSTEMS = ("npm", "python", "go")
+
+# (license_id, spdx_expression, name) with their weight.
+LICENSES: list[tuple[tuple[str, str, str], int]] = [
+    (("MIT", "MIT", "MIT License"), 40),
+    (("Apache-2.0", "Apache-2.0", "Apache License 2.0"), 20),
+    (("BSD-3-Clause", "BSD-3-Clause", 'BSD 3-Clause "New" or "Revised" License'), 10),
+    (("ISC", "ISC", "ISC License"), 8),
+    (("0BSD", "0BSD", "BSD Zero Clause License"), 4),
+    (("", "MIT OR Apache-2.0", ""), 4),
+    (("", "(MIT AND Zlib) OR GPL-3.0-only", ""), 1),
+    (("", "", "mit"), 2),
+    (("", "", "Custom <b>License</b> & Co"), 1),
+    (("", "", "Evil \x1b[31mLicense\x1b[0m"), 1),
+    # Missing license.
+    (("", "", ""), 3),
+]
+
+NAME_PREFIXES = ("lib", "py", "node", "go", "react", "django", "type", "core")
+
+
+def _generate_package_name(rng: random.Random, index: int) -> str:
+    name = f"{rng.choice(NAME_PREFIXES)}-{index}"
+    roll = rng.random()
+    if roll < 0.05:
+        return name.capitalize()
+    if roll < 0.06:
+        return f"<i>{name}</i>"
+    if roll < 0.07:
+        return f"{name}\x1b[1m"
+    return name
+
+
+def generate_grant_report(size: int, seed: int = 0) -> dict[str, Any]:
+    """Returns a grant JSON report (as a dict) with `size` results."""
+    rng = random.Random(seed)
+    licenses, weights = zip(*LICENSES)
+
+    # Most packages are unique, some are duplicated or have multiple licenses.
+    package_count = max(1, int(size * 0.8))
+    packages = [
+        (_generate_package_name(rng, index), rng.choice(ECOSYSTEMS))
+        for index in range(package_count)
+    ]
+    # Packages sharing the same name across ecosystems, or only differing by case.
+    for index in range(0, package_count, 50):
+        name, ecosystem = packages[index]
+        packages.append((name, rng.choice(ECOSYSTEMS)))
+        packages.append((name.upper(), ecosystem))
+
+    results = []
+    for _ in range(size):
+        name, ecosystem = rng.choice(packages)
+        license_id, spdx_expression, license_name = rng.choices(licenses, weights)[0]
+        results.append(
+            {
+                "input": "./bom.json",
+                "license": {
+                    "license_id": license_id,
+                    "spdx_expression": spdx_expression,
+                    "name": license_name,
+                    "locations": [],
+                },
+                "package": {
+                    "name": name,
+                    "version": f"{rng.randint(0, 9)}.{rng.randint(0, 20)}.0",
+                    "type": ecosystem,
+                    "locations": [],
+                },
+                "passed": True,
+                "reasons": ["default-allow-all: license allowed by policy"],
+            }
+        )
+
+    return {
+        "report_id": "",
+        "timestamp": "2025-08-27T15:41:52+02:00",
+        "inputs": ["./bom.json"],
+        "results": results,
+    }
+
+
+def generate_grant_report_json(size: int, seed: int = 0) -> str:
+    return json.dumps(generate_grant_report(size, seed), indent=2)
+
+
+def generate_sbom(report: GrantResponse) -> dict[str, Any]:
+    """Returns a CycloneDX 1.6 SBOM containing the packages and licenses of a report.
+
+    Each package is a component identified by its package URL.
+    """
+    components: dict[str, dict[str, Any]] = {}
+    for eval_result in report.results:
+        package = eval_result.package
+        purl = f"pkg:{package.type}/{package.name}"
+        component = components.setdefault(
+            purl,
+            {
+                "type": "library",
+                "name": package.name,
+                "purl": purl,
+                "bom-ref": purl,
+                "properties": [{"name": "cdx:type", "value": package.type}],
+                "licenses": [],
+            },
+        )
+        license_entry = {"license": eval_result.license.model_dump()}
+        if license_entry not in component["licenses"]:
+            component["licenses"].append(license_entry)
+
+    return {
+        "bomFormat": "CycloneDX",
+        "specVersion": "1.6",
+        "serialNumber": "urn:uuid:00000000-0000-0000-0000-000000000000",
+        "version": 1,
+        "metadata": {"component": {"name": "synthetic", "type": "application"}},
+        "components": list(components.values()),
+        "dependencies": [
+            {"ref": "synthetic", "dependsOn": list(components.keys())},
+        ],
+    }
+
+
+def sbom_to_grant_report(sbom: dict[str, Any]) -> GrantResponse:
+    """Reverses `generate_sbom()`, returns one result per component license."""
+    return GrantResponse.model_validate(
+        {
+            "timestamp": "",
+            "inputs": [],
+            "results": [
+                {
+                    "license": license_entry["license"],
+                    "package": {
+                        "name": component["name"],
+                        "type": component["properties"][0]["value"],
+                    },
+                }
+                for component in sbom["components"]
+                for license_entry in component["licenses"]
+            ],
+        }
+    )
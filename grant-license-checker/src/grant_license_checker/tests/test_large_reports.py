@@ -0,0 +1,131 @@
+"""
+Differential tests checking that the fast paths return the same output as
+the reference implementation (BaseRenderer, which groups results using
+LicenseIndex, and the Jinja templates) at scale.
+"""
+from io import StringIO
+
+import pytest
+
+from grant_license_checker.conftest import within_time_budget
+from grant_license_checker.pipeline.runner import run_pipeline
+from grant_license_checker.renderers import COMPILED_RENDERERS, RENDERERS, BaseRenderer
+from grant_license_checker.renderers.html import escape_html
+from grant_license_checker.renderers.tty import sanitize_name
+from grant_license_checker.sbom.merge import merge_sboms
+from grant_license_checker.tests.synthetic import generate_sbom, sbom_to_grant_report
+
+
+@pytest.mark.parametrize("chunk_size", [1024, 64 * 1024])
+def test_pipeline_matches_reference(
+    synthetic_grant_json, synthetic_grant_report, reference_grouping, chunk_size
+):
+    with within_time_budget():
+        data, index = run_pipeline(
+            StringIO(synthetic_grant_json), chunk_size=chunk_size, queue_size=4
+        )
+
+    assert data == synthetic_grant_report
+    assert (
+        index.seal(),
+        index.get_packages_with_multiple_licenses(),
+    ) == reference_grouping
+
+
+# Note: TSV has no compiled renderer (same class for both engines).
+@pytest.mark.parametrize("output_format", ["html", "tty"])
+@pytest.mark.parametrize("report", ["licenses", "multi-license"])
+@pytest.mark.parametrize("max_package_count", [-1, 20])
+def test_compiled_renderers_match_templates(
+    synthetic_grant_report,
+    reference_grouping,
+    output_format,
+    report,
+    max_package_count,
+):
+    """Compiled renderers (and their caches) should render the same as templates."""
+
+    def render(renderer_cls) -> str:
+        out_fp = StringIO()
+        renderer_cls(
+            data=synthetic_grant_report,
+            list_packages=True,
+            max_package_count=max_package_count,
+            packages_by_license=reference_grouping[0],
+            multi_license_packages=reference_grouping[1],
+            report=report,
+        ).render(out_fp)
+        return out_fp.getvalue()
+
+    expected = render(RENDERERS[output_format])
+
+    # The escape caches are module-level, thus shared across tests.
+    escape_html.cache_clear()
+    sanitize_name.cache_clear()
+    with within_time_budget():
+        # Rendered twice: with cold, then warm escape caches.
+        outputs = [render(COMPILED_RENDERERS[output_format]) for _ in range(2)]
+
+    assert outputs == [expected, expected]
+
+
+def canonicalize(grouping):
+    """Sorts ties (same case-insensitive name) as SBOMs don't keep the result order."""
+    packages_by_license, licenses_by_package = grouping
+    return (
+        [
+            (license_name, sorted(packages, key=lambda o: (o.name, o.type)))
+            for license_name, packages in packages_by_license
+        ],
+        [
+            (package, sorted(licenses)) for package, licenses in licenses_by_package
+        ],
+    )
+
+
+def test_merged_sboms_match_reference(synthetic_grant_report, reference_grouping):
+    """Merging per-ecosystem SBOMs should lose or duplicate no package nor license."""
+    sbom = generate_sbom(synthetic_grant_report)
+
+    # Split per ecosystem (as generated by concurrent cdxgen processes), each SBOM
+    # also contains some components of the other ecosystems (duplicates).
+    parts = [
+        {
+            **sbom,
+            "components": [
+                component
+                for position, component in enumerate(sbom["components"])
+                if component["properties"][0]["value"] == ecosystem
+                or position % 7 == 0
+            ],
+        }
+        for ecosystem in ("npm", "python", "go")
+    ]
+
+    with within_time_budget():
+        merged = merge_sboms(parts)
+
+    renderer = BaseRenderer(
+        data=sbom_to_grant_report(merged), list_packages=True, max_package_count=-1
+    )
+    assert canonicalize(renderer.group_results()) == canonicalize(reference_grouping)
+
+
+def test_synthetic_report_has_edge_cases(synthetic_grant_report, reference_grouping):
+    """Ensures the synthetic reports cover the edge cases of real reports."""
+    packages = [
+        (result.package.name, result.package.type)
+        for result in synthetic_grant_report.results
+    ]
+    license_names = {license_name for license_name, _ in reference_grouping[0]}
+
+    # Duplicates
+    assert len(set(packages)) < len(packages)
+    # Packages with multiple licenses
+    assert reference_grouping[1]
+    # Same package name across ecosystems, and names only differing by case.
+    assert len({name for name, _ in packages}) < len(set(packages))
+    assert len({name.lower() for name, _ in packages}) < len({n for n, _ in packages})
+    # License names only differing by case, and missing licenses.
+    assert {"MIT", "mit"} <= license_names
+    assert "<<missing>>" in license_names
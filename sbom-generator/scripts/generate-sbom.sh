@@ -2,6 +2,8 @@
 
 set -eu -o pipefail
 
+HERE=$(dirname "$(readlink -f "$0")")
+
 function log() {
     msg="$1"
     shift
@@ -22,27 +24,426 @@ fi
 # - CONF_PROJECT_DIR: the path of the project to scan (relative or absolute).
 # - CONF_ECOSYSTEMS: list of ecosystems to scan (e.g., python), whitespace separated.
 # - CONF_RESULT_PATH: the path where to store the SBOM.
+# - CONF_CACHE_DIR: the directory where to cache SBOMs and license metadata
+#   across runs (caching is disabled when empty).
+# - CONF_MAX_JOBS: how many cdxgen processes can run concurrently (one per ecosystem).
 CONF_PROJECT_DIR="${CONF_PROJECT_DIR:-$PWD}"
 CONF_ECOSYSTEMS="${CONF_ECOSYSTEMS:-}"
 CONF_RESULT_PATH=${CONF_RESULT_PATH:-./bom.json}
+CONF_CACHE_DIR="${CONF_CACHE_DIR:-}"
+CONF_MAX_JOBS="${CONF_MAX_JOBS:-2}"
+
+# The merge command lives in grant-license-checker (only depends on the standard library).
+MERGE_SBOMS_PYTHONPATH="$HERE/../../grant-license-checker/src"
+
+# Bump whenever the cdxgen arguments or the cache layout change in order
+# to invalidate existing caches.
+CACHE_FORMAT_VERSION=2
+
+# The maximum number of new packages whose licenses are fetched one by one
+# (see `resolve_missing_licenses()`), the SBOM is generated again with cdxgen's
+# license fetching otherwise.
+MAX_RESOLVED_PACKAGES=200
+
+# The files whose changes can lead to a different SBOM (i.e., manifests and lockfiles),
+# per cdxgen project type. Patterns containing a '/' are matched against the path
+# (e.g., 'requirements/base.txt'), others against the filename.
+#
+# The SBOM is only restored from the cache when every selected ecosystem is listed
+# here, otherwise a change to an unlisted file would restore a stale SBOM.
+declare -A LOCKFILE_PATTERNS=(
+    [python]="pyproject.toml setup.py setup.cfg *requirements*.txt requirements/*.txt
+              requirements/*.in Pipfile Pipfile.lock poetry.lock uv.lock pdm.lock"
+    [javascript]="package.json package-lock.json npm-shrinkwrap.json pnpm-lock.yaml
+                  pnpm-workspace.yaml yarn.lock bun.lock bun.lockb"
+    [go]="go.mod go.sum go.work go.work.sum Gopkg.lock"
+    [rust]="Cargo.toml Cargo.lock"
+    [ruby]="Gemfile Gemfile.lock *.gemspec"
+    [php]="composer.json composer.lock"
+    [java]="pom.xml build.gradle build.gradle.kts settings.gradle settings.gradle.kts
+            gradle.properties gradle.lockfile libs.versions.toml"
+)
+
+# Aliases of the cdxgen project types above
+# (https://cyclonedx.github.io/cdxgen/#/PROJECT_TYPES).
+declare -A ECOSYSTEM_ALIASES=(
+    [py]=python [pypi]=python [poetry]=python
+    [js]=javascript [ts]=javascript [typescript]=javascript [nodejs]=javascript
+    [npm]=javascript [pnpm]=javascript [yarn]=javascript [tsx]=javascript
+    [golang]=go
+    [cargo]=rust [rust-lang]=rust
+    [gems]=ruby
+    [composer]=php
+    [maven]=java [gradle]=java
+)
 
 cmd_args=(
     "--recurse"
-    "--output=$CONF_RESULT_PATH"
     "--profile=license-compliance"
     # Prevent unintended spec upgrades as it may break 'grant-summarize'
     # if the new spec isn't supported yet.
     "--spec-version=1.6"
-    # Path to the source code to analyze
-    "$CONF_PROJECT_DIR"
 )
 
-# Add project types into the 'cdxgen' command line argument list.
 read -d '' -r -a ecosystems < <(echo "$CONF_ECOSYSTEMS") || true
-for ecosystem in "${ecosystems[@]}"; do
-    cmd_args+=("--type=$ecosystem")
-done
 
-# Generate the BOM.
-log "Generating SBOM..."
-FETCH_LICENSE=true cdxgen "${cmd_args[@]}"
+tmp_dir=$(mktemp -d)
+trap 'rm -rf "$tmp_dir"' EXIT
+
+# Runs a single cdxgen process.
+#
+# run_cdxgen_process(fetch_license, output_path, ecosystems...)
+function run_cdxgen_process() {
+    local fetch_license="$1"
+    local output_path="$2"
+    shift 2
+
+    local type_args=()
+    for ecosystem in "$@"; do
+        type_args+=("--type=$ecosystem")
+    done
+
+    FETCH_LICENSE="$fetch_license" cdxgen \
+        "${cmd_args[@]}" \
+        "${type_args[@]}" \
+        "--output=$output_path" \
+        "$CONF_PROJECT_DIR"
+}
+
+# Generates the SBOM into a given path.
+#
+# When multiple ecosystems are selected, one cdxgen process is started per ecosystem
+# (up to CONF_MAX_JOBS at once), then the resulting SBOMs are merged.
+#
+# run_cdxgen(fetch_license, output_path)
+function run_cdxgen() {
+    local fetch_license="$1"
+    local output_path="$2"
+
+    if [[ "${#ecosystems[@]}" -lt 2 || "$CONF_MAX_JOBS" -lt 2 ]]; then
+        run_cdxgen_process "$fetch_license" "$output_path" "${ecosystems[@]}"
+        return
+    fi
+
+    # Merging SBOMs requires Python 3.8+, scan every ecosystem using a single
+    # process otherwise.
+    if ! python3 -c 'import sys; sys.exit(sys.version_info < (3, 8))' 2>/dev/null; then
+        log "Python 3.8+ is required to scan ecosystems concurrently, scanning serially..."
+        run_cdxgen_process "$fetch_license" "$output_path" "${ecosystems[@]}"
+        return
+    fi
+
+    local parts_dir
+    parts_dir=$(mktemp -d -p "$tmp_dir")
+
+    local pids=() part_paths=()
+    for ecosystem in "${ecosystems[@]}"; do
+        # Wait for a job to finish when the maximum job count is reached.
+        while [[ "$(jobs -rp | wc -l)" -ge "$CONF_MAX_JOBS" ]]; do
+            wait -n || true
+        done
+
+        part_paths+=("$parts_dir/bom-${#part_paths[@]}.json")
+        run_cdxgen_process "$fetch_license" "${part_paths[-1]}" "$ecosystem" &
+        pids+=("$!")
+    done
+
+    # Fail if any of the processes failed.
+    for pid in "${pids[@]}"; do
+        wait "$pid"
+    done
+
+    log "Merging SBOMs..."
+    PYTHONPATH="$MERGE_SBOMS_PYTHONPATH" python3 -m grant_license_checker.cmd.merge_sboms \
+        --output="$output_path" \
+        "${part_paths[@]}"
+}
+
+# Prints the manifest and lockfile patterns of the selected ecosystems.
+#
+# Exits with a non-zero code if the patterns of an ecosystem are unknown,
+# or if no ecosystem was selected (cdxgen then scans every ecosystem).
+function get_lockfile_patterns() {
+    [[ "${#ecosystems[@]}" -gt 0 ]] || return 1
+
+    local ecosystem patterns=()
+    for ecosystem in "${ecosystems[@]}"; do
+        ecosystem="${ecosystem,,}"
+        ecosystem="${ECOSYSTEM_ALIASES[$ecosystem]:-$ecosystem}"
+        [[ -n "${LOCKFILE_PATTERNS[$ecosystem]+x}" ]] || return 1
+        # Note: 'read' doesn't expand the globs.
+        read -d '' -r -a patterns <<<"${LOCKFILE_PATTERNS[$ecosystem]}" || true
+        printf '%s\n' "${patterns[@]}"
+    done
+}
+
+# Prints the SHA-256 hash of every manifest and lockfile found in the project,
+# in a stable order.
+#
+# hash_lockfiles(patterns...)
+function hash_lockfiles() {
+    local find_args=()
+    for pattern in "$@"; do
+        if [[ "$pattern" == */* ]]; then
+            find_args+=(-o -path "*/$pattern")
+        else
+            find_args+=(-o -name "$pattern")
+        fi
+    done
+
+    # Note: 'cdxgen --recurse' never resolves from vendored dependencies, thus they
+    #       are excluded as they can be very large.
+    (
+        cd "$CONF_PROJECT_DIR"
+        find . \
+            \( -name node_modules -o -name .git -o -name .venv \) -prune \
+            -o -type f \( -false "${find_args[@]}" \) -print0 \
+            | LC_ALL=C sort -z \
+            | xargs -0 --no-run-if-empty sha256sum
+    )
+}
+
+# Prints the cache key of the SBOM, it changes whenever either of these change:
+# - the cdxgen version,
+# - the selected ecosystems,
+# - the maximum job count (whether ecosystems are scanned separately then merged),
+# - the content or location of a lockfile.
+#
+# get_cache_key(lockfile_patterns...)
+function get_cache_key() {
+    {
+        echo "format=$CACHE_FORMAT_VERSION"
+        echo "cdxgen=$cdxgen_version"
+        echo "max_jobs=$CONF_MAX_JOBS"
+        printf 'ecosystem=%s\n' "${ecosystems[@]}" | LC_ALL=C sort
+        hash_lockfiles "$@"
+    } | sha256sum | cut -d' ' -f1
+}
+
+# Stores the licenses of every component of a SBOM into the license cache
+# (maps package URLs to a CycloneDX license list).
+#
+# Packages without any license found are not stored, as cdxgen may have failed
+# to fetch them (e.g., registry timeout or rate limit), they are resolved again
+# on the next run instead of remaining without license.
+#
+# update_license_cache(sbom_path, cache_path)
+function update_license_cache() {
+    local sbom_path="$1"
+    local cache_path="$2"
+    local tmp_path="$cache_path.tmp"
+
+    [[ -f "$cache_path" ]] || echo '{}' >"$cache_path"
+    jq --slurpfile sbom "$sbom_path" \
+        '. + ([$sbom[0].components[]? | select(.purl) | select(.licenses | length > 0) | {(.purl): .licenses}] | add // {})' \
+        "$cache_path" >"$tmp_path"
+    mv "$tmp_path" "$cache_path"
+}
+
+# Prints the CycloneDX license list of a package given its package URL, fetched
+# from the package's registry (only npm and PyPI are supported).
+#
+# Only licenses that are SPDX IDs (or SPDX expressions made of SPDX IDs) found in
+# cdxgen's SPDX license list are accepted, as cdxgen maps other values (e.g., 'BSD'
+# or 'Apache 2') using its own rules. Other values are left to cdxgen in order
+# for the SBOM to be the same whether licenses came from the cache or not.
+#
+# Exits with a non-zero code if the package isn't supported, or if the registry
+# doesn't return any license, or if the license isn't a known SPDX ID.
+#
+# fetch_package_licenses(purl, spdx_licenses_path)
+function fetch_package_licenses() {
+    local purl="$1"
+    local spdx_licenses_path="$2"
+
+    # Format: pkg:<type>/<namespace>/<name>@<version>?<qualifiers>#<subpath>
+    local path="${purl%%[?#]*}"
+    [[ "$path" == pkg:*/*@* ]] || return 1
+    local type="${path#pkg:}"
+    type="${type%%/*}"
+    path="${path#pkg:*/}"
+    local name="${path%@*}"
+    local version="${path##*@}"
+    name="${name//%40/@}"
+
+    local url license_filter
+    case "$type" in
+    npm)
+        url="https://registry.npmjs.org/$name/$version"
+        license_filter='
+            def license_type: if type == "object" then .type else . end;
+            (.license | license_type)
+                // ((.licenses // []) | map(license_type) | join(" OR "))'
+        ;;
+    pypi)
+        url="https://pypi.org/pypi/$name/$version/json"
+        # Note: 'license' may contain the full license text, it's unusable in that case.
+        license_filter='
+            [.info.license_expression, .info.license]
+                | map(select(. != null and . != "" and (test("\n") | not) and length <= 100))
+                | .[0]'
+        ;;
+    *)
+        return 1
+        ;;
+    esac
+
+    curl --silent --fail --location --retry 2 --max-time 30 "$url" \
+        | jq --exit-status --compact-output --slurpfile spdx "$spdx_licenses_path" "
+            (\$spdx[0]
+                | if type == \"object\" then keys else map(.licenseId? // .) end
+                | map({(.): true}) | add)
+                as \$spdx_ids
+            | ($license_filter)
+            | select(. != null and . != \"\")
+            | if test(\" (OR|AND|WITH) \") then
+                  select(
+                      all(scan(\"[^()\\\\s]+\") | select(IN(\"OR\", \"AND\", \"WITH\") | not);
+                          \$spdx_ids[.])
+                  )
+                  | [{expression: .}]
+              else
+                  select(\$spdx_ids[.]) | [{license: {id: .}}]
+              end"
+}
+
+# Prints the path of the SPDX license list shipped with cdxgen
+# (<package>/bin/cdxgen.js and <package>/data/spdx-licenses.json).
+function get_spdx_licenses_path() {
+    local cdxgen_path
+    cdxgen_path=$(readlink -f "$(command -v cdxgen)") || return 1
+    echo "$(dirname "$cdxgen_path")/../data/spdx-licenses.json"
+}
+
+# Fetches the licenses of the packages of a SBOM that are missing from
+# the license cache, and stores them into the cache.
+#
+# Exits with a non-zero code (without updating the cache) if a package cannot
+# be resolved (see `fetch_package_licenses()`), or if too many packages are
+# missing (a full cdxgen pass is faster then).
+#
+# resolve_missing_licenses(sbom_path, cache_path)
+function resolve_missing_licenses() {
+    local sbom_path="$1"
+    local cache_path="$2"
+    local resolved_path="$tmp_dir/resolved-licenses.jsonl"
+
+    local missing_purls=()
+    mapfile -t missing_purls < <(
+        jq -r --slurpfile cache "$cache_path" \
+            '.components[]? | .purl // empty | select(in($cache[0]) | not)' \
+            "$sbom_path" | LC_ALL=C sort -u
+    )
+
+    if [[ "${#missing_purls[@]}" -gt "$MAX_RESOLVED_PACKAGES" ]]; then
+        log "%d packages are missing in the license cache (maximum: %d)" \
+            "${#missing_purls[@]}" "$MAX_RESOLVED_PACKAGES"
+        return 1
+    fi
+
+    local spdx_licenses_path
+    spdx_licenses_path=$(get_spdx_licenses_path)
+    if [[ ! -f "$spdx_licenses_path" ]]; then
+        log "SPDX license list not found (%s)" "$spdx_licenses_path"
+        return 1
+    fi
+
+    log "Fetching the licenses of %d new packages..." "${#missing_purls[@]}"
+    local purl licenses
+    : >"$resolved_path"
+    for purl in "${missing_purls[@]}"; do
+        if ! licenses=$(fetch_package_licenses "$purl" "$spdx_licenses_path"); then
+            log "Cannot fetch the licenses of %s" "$purl"
+            return 1
+        fi
+        jq -n -c --arg purl "$purl" --argjson licenses "$licenses" \
+            '{($purl): $licenses}' >>"$resolved_path"
+    done
+
+    jq -s '.[0] + (.[1:] | add // {})' "$cache_path" "$resolved_path" >"$cache_path.tmp"
+    mv "$cache_path.tmp" "$cache_path"
+}
+
+# Fills the licenses of the components of a SBOM (generated without fetching
+# licenses) using the license cache.
+#
+# Exits with a non-zero code if a component isn't in the cache, in which case
+# the licenses need to be fetched.
+#
+# apply_license_cache(sbom_path, cache_path, output_path)
+function apply_license_cache() {
+    local sbom_path="$1"
+    local cache_path="$2"
+    local output_path="$3"
+
+    [[ -f "$cache_path" ]] || return 1
+
+    # Exit with an error if any package is missing from the cache.
+    jq --exit-status --slurpfile cache "$cache_path" \
+        'all(.components[]? | select(.purl); .purl | in($cache[0]))' \
+        "$sbom_path" >/dev/null || return 1
+
+    jq --slurpfile cache "$cache_path" \
+        '.components |= map(if .purl then .licenses = $cache[0][.purl] else . end)' \
+        "$sbom_path" >"$output_path"
+}
+
+# Generates the SBOM without any caching.
+if [[ -z "$CONF_CACHE_DIR" ]]; then
+    log "Generating SBOM..."
+    run_cdxgen true "$CONF_RESULT_PATH"
+    exit 0
+fi
+
+mkdir -p "$CONF_CACHE_DIR"/sboms "$CONF_CACHE_DIR"/licenses
+cdxgen_version=$(cdxgen --version)
+# License metadata may be formatted differently across cdxgen versions.
+license_cache_path="$CONF_CACHE_DIR/licenses/${cdxgen_version//[^[:alnum:].-]/_}.json"
+
+cached_sbom_path=
+if lockfile_patterns=$(get_lockfile_patterns); then
+    mapfile -t lockfile_patterns <<<"$lockfile_patterns"
+    cache_key=$(get_cache_key "${lockfile_patterns[@]}")
+    cached_sbom_path="$CONF_CACHE_DIR/sboms/$cache_key.json"
+
+    # No lockfile changed since the last run, restore the previous SBOM.
+    if [[ -f "$cached_sbom_path" ]]; then
+        log "Restoring SBOM from cache (key: %s)..." "$cache_key"
+        cp "$cached_sbom_path" "$CONF_RESULT_PATH"
+        exit 0
+    fi
+else
+    log "The lockfiles of some ecosystems are unknown, SBOM will not be restored from cache"
+fi
+
+if [[ ! -f "$license_cache_path" ]]; then
+    log "License cache is empty, generating SBOM..."
+    run_cdxgen true "$CONF_RESULT_PATH"
+    update_license_cache "$CONF_RESULT_PATH" "$license_cache_path"
+else
+    # Generate the SBOM without fetching licenses (no network access to package
+    # registries, thus much faster), then take the licenses from the license cache
+    # and only fetch the licenses of new packages.
+    log "Generating SBOM without fetching licenses..."
+    run_cdxgen false "$tmp_dir"/bom-no-license.json
+    if resolve_missing_licenses "$tmp_dir"/bom-no-license.json "$license_cache_path" \
+        && apply_license_cache "$tmp_dir"/bom-no-license.json "$license_cache_path" "$CONF_RESULT_PATH"; then
+        log "Licenses were resolved using the license cache"
+    else
+        # Costs a second cdxgen pass.
+        log "Some licenses cannot be resolved per package, generating SBOM..."
+        run_cdxgen true "$CONF_RESULT_PATH"
+        update_license_cache "$CONF_RESULT_PATH" "$license_cache_path"
+    fi
+fi
+
+# Do not cache SBOMs with packages without license, as cdxgen may have failed to
+# fetch them (they are resolved again on the next run, see `update_license_cache()`).
+if jq --exit-status 'any(.components[]?; .licenses | length == 0)' "$CONF_RESULT_PATH" >/dev/null; then
+    log "Some packages have no license, SBOM will not be cached"
+elif [[ -n "$cached_sbom_path" ]]; then
+    # Write to a temporary file first, a truncated SBOM (e.g., job cancelled)
+    # would be restored on every run otherwise.
+    cp "$CONF_RESULT_PATH" "$cached_sbom_path.tmp"
+    mv "$cached_sbom_path.tmp" "$cached_sbom_path"
+fi
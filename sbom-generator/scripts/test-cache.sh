@@ -0,0 +1,202 @@
+#!/usr/bin/env bash
+
+# Tests the caching of generate-sbom.sh using fake 'cdxgen' and 'curl' commands
+# (no network access needed).
+
+set -eu -o pipefail
+
+HERE=$(dirname "$(readlink -f "$0")")
+
+cd "$HERE"
+
+info() {
+  echo "INFO: $*" >&2
+}
+
+error() {
+  echo "ERROR: $*" >&2
+}
+
+tempdir=$(mktemp -d)
+project_path="$tempdir/project"
+cache_path="$tempdir/cache"
+bom_path="$tempdir/bom.json"
+# The commands run by the fake cdxgen and curl, one per line.
+calls_path="$tempdir/calls.log"
+
+cleanup() {
+  rm -rf "$tempdir"
+}
+
+trap cleanup EXIT
+
+# Creates fake 'cdxgen' and 'curl' commands in $tempdir/bin.
+#
+# The fake cdxgen reads the packages from requirements/base.txt in the project
+# (one '<purl> <license>' per line), licenses are only set when FETCH_LICENSE=true.
+# The fake curl returns a MIT license for every PyPI package, and a non-SPDX
+# license for packages named 'nonspdx-*'.
+#
+# Both fail to fetch the licenses of the package URLs listed in FAKE_FAILED_PURLS
+# (whitespace separated), e.g., registry timeout.
+setup_fake_commands() {
+  mkdir -p "$tempdir/bin" "$tempdir/data"
+
+  # cdxgen's SPDX license list (<package>/data/spdx-licenses.json).
+  echo '["MIT", "BSD-3-Clause", "Apache-2.0"]' >"$tempdir/data/spdx-licenses.json"
+
+  cat >"$tempdir/bin/cdxgen" <<'EOF'
+#!/usr/bin/env bash
+set -eu -o pipefail
+
+if [[ "$1" == "--version" ]]; then
+  echo "11.6.0"
+  exit 0
+fi
+
+output_path=
+for arg in "$@"; do
+  case "$arg" in
+  --output=*) output_path="${arg#--output=}" ;;
+  esac
+done
+project_path="${*: -1}"
+
+echo "cdxgen fetch_license=$FETCH_LICENSE" >>"$FAKE_CALLS_PATH"
+jq -R -s --arg fetch_license "$FETCH_LICENSE" --arg failed "${FAKE_FAILED_PURLS:-}" '{
+  bomFormat: "CycloneDX",
+  specVersion: "1.6",
+  metadata: {},
+  components: [
+    split("\n")[] | select(. != "") | split(" ") | {
+      name: .[0], purl: .[0],
+      licenses: (
+        if $fetch_license == "true" and (.[0] | IN($failed | splits("\\s+")) | not)
+        then [{license: {id: .[1]}}] else [] end
+      )
+    }
+  ]
+}' "$project_path/requirements/base.txt" >"$output_path"
+EOF
+
+  cat >"$tempdir/bin/curl" <<'EOF'
+#!/usr/bin/env bash
+url="${*: -1}"
+echo "curl $url" >>"$FAKE_CALLS_PATH"
+for purl in ${FAKE_FAILED_PURLS:-}; do
+  name="${purl#pkg:pypi/}"
+  [[ "$url" == */"${name%@*}"/* ]] && exit 22
+done
+case "$url" in
+*/nonspdx-*) echo '{"info": {"license_expression": null, "license": "BSD"}}' ;;
+*) echo '{"info": {"license_expression": "MIT", "license": null}}' ;;
+esac
+EOF
+
+  chmod +x "$tempdir/bin/cdxgen" "$tempdir/bin/curl"
+}
+
+# Generates the SBOM of the test project using generate-sbom.sh.
+#
+# run_generate_sbom(ecosystems)
+run_generate_sbom() {
+  : >"$calls_path"
+  PATH="$tempdir/bin:$PATH" \
+    FAKE_CALLS_PATH="$calls_path" \
+    CONF_PROJECT_DIR="$project_path" \
+    CONF_ECOSYSTEMS="$1" \
+    CONF_RESULT_PATH="$bom_path" \
+    CONF_CACHE_DIR="$cache_path" \
+    ./generate-sbom.sh 2>"$tempdir/stderr.log"
+}
+
+# Checks the commands run by the last generate-sbom.sh run.
+#
+# assert_calls(test_name, expected_calls...)
+assert_calls() {
+  local test_name="$1"
+  shift
+
+  if ! diff <(printf '%s\n' "$@" | sed '/^$/d') "$calls_path"; then
+    error "Test failed ($test_name): unexpected cdxgen or curl calls (see above)"
+    cat "$tempdir/stderr.log" >&2
+    exit 1
+  fi
+}
+
+# Checks the license ID of a package in the last generated SBOM.
+#
+# assert_license(test_name, purl, license_id)
+assert_license() {
+  if ! jq --exit-status --arg purl "$2" --arg id "$3" \
+    '.components[] | select(.purl == $purl) | .licenses[].license | select(.id == $id)' \
+    "$bom_path" >/dev/null; then
+    error "Test failed ($1): didn't find $2 with a $3 license"
+    exit 1
+  fi
+}
+
+main() {
+  setup_fake_commands
+  mkdir -p "$project_path/requirements"
+  echo "pkg:pypi/django@5.2.0 BSD-3-Clause" >"$project_path/requirements/base.txt"
+
+  info "Checking the first run fetches licenses in a single pass..."
+  run_generate_sbom python
+  assert_calls "first run" "cdxgen fetch_license=true"
+  assert_license "first run" "pkg:pypi/django@5.2.0" "BSD-3-Clause"
+
+  info "Checking the SBOM is restored when no lockfile changed..."
+  run_generate_sbom python
+  assert_calls "no change"
+  assert_license "no change" "pkg:pypi/django@5.2.0" "BSD-3-Clause"
+
+  info "Checking only new packages are resolved when a nested lockfile changes..."
+  echo "pkg:pypi/asgiref@3.9.0 BSD-3-Clause" >>"$project_path/requirements/base.txt"
+  run_generate_sbom python
+  assert_calls "new package" \
+    "cdxgen fetch_license=false" \
+    "curl https://pypi.org/pypi/asgiref/3.9.0/json"
+  assert_license "new package" "pkg:pypi/django@5.2.0" "BSD-3-Clause"
+  assert_license "new package" "pkg:pypi/asgiref@3.9.0" "MIT"
+
+  info "Checking licenses that failed to be fetched are fetched again on the next run..."
+  echo "pkg:pypi/flaky@1.0.0 BSD-3-Clause" >>"$project_path/requirements/base.txt"
+  FAKE_FAILED_PURLS="pkg:pypi/flaky@1.0.0" run_generate_sbom python
+  assert_calls "failed fetch" \
+    "cdxgen fetch_license=false" \
+    "curl https://pypi.org/pypi/flaky/1.0.0/json" \
+    "cdxgen fetch_license=true"
+  run_generate_sbom python
+  assert_calls "failed fetch (next run)" \
+    "cdxgen fetch_license=false" \
+    "curl https://pypi.org/pypi/flaky/1.0.0/json"
+  assert_license "failed fetch (next run)" "pkg:pypi/flaky@1.0.0" "MIT"
+
+  info "Checking non-SPDX licenses are left to cdxgen..."
+  echo "pkg:pypi/nonspdx-lib@1.0.0 BSD-3-Clause" >>"$project_path/requirements/base.txt"
+  run_generate_sbom python
+  assert_calls "non-SPDX license" \
+    "cdxgen fetch_license=false" \
+    "curl https://pypi.org/pypi/nonspdx-lib/1.0.0/json" \
+    "cdxgen fetch_license=true"
+  assert_license "non-SPDX license" "pkg:pypi/nonspdx-lib@1.0.0" "BSD-3-Clause"
+
+  info "Checking licenses are fetched by cdxgen when they can't be resolved per package..."
+  echo "pkg:cargo/serde@1.0.0 Apache-2.0" >>"$project_path/requirements/base.txt"
+  run_generate_sbom python
+  assert_calls "unsupported package" \
+    "cdxgen fetch_license=false" \
+    "cdxgen fetch_license=true"
+  assert_license "unsupported package" "pkg:cargo/serde@1.0.0" "Apache-2.0"
+
+  info "Checking the SBOM isn't restored when scanning all ecosystems..."
+  run_generate_sbom ""
+  run_generate_sbom ""
+  assert_calls "all ecosystems" "cdxgen fetch_license=false"
+  assert_license "all ecosystems" "pkg:cargo/serde@1.0.0" "Apache-2.0"
+
+  info "All tests passed"
+}
+
+main "$@"